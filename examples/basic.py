@@ -23,10 +23,10 @@ from streams import SinglyLinkedStream as Stream
 if __name__ == '__main__':
     ones = Stream(1, lambda: ones)
     print('Stream of ones:')
-    print(list(ones[:10]))
+    print(ones.take(10))
     print()
 
     ints = Stream(1, lambda: Stream.map(add, ones, ints))
     print(ints)
     print('Stream of natural numbers:')
-    print(list(ints[:10]))
+    print(ints.take(10))
@@ -34,34 +34,45 @@ if __name__ == '__main__':
 
     leibniz = Stream.map(truediv, numerators, denominators)
     print('The Leibniz sequence:')
-    print(list(leibniz[:10]))
+    print(leibniz.take(10))
     print()
 
-    partial_sums = Stream(
-        leibniz.value,
-        lambda: Stream.map(add, leibniz.next, partial_sums)
-    )
+    partial_sums = Stream.scan(add, leibniz)
     print('The partial sums of the Leibniz sequence:')
-    print(list(partial_sums[:10]))
+    print(partial_sums.take(10))
     print()
 
+    # The tableau below applies the transformation to streams that have
+    # already been transformed (starting with partial_sums itself), so
+    # the results are cached by the identity of the input node. The
+    # input node is stored alongside its result so that its id can't be
+    # reused by another node.
+    shanks_cache = {}
+
     def shanks_transformation(stream):
+        if (cached := shanks_cache.get(id(stream))) is not None:
+            return cached[1]
+
+        following = stream.next
         s0 = stream.value
-        s1 = stream.next.value
-        s2 = stream.next.next.value
+        s1 = following.value
+        s2 = following.next.value
         denominator = s0 - s1 - (s1 - s2)
 
-        return Stream(
+        transformed = Stream(
             s1 if denominator == 0 else s2 - (s2 - s1) ** 2 / denominator,
-            lambda: shanks_transformation(stream.next)
+            lambda: shanks_transformation(following)
         )
+        shanks_cache[id(stream)] = (stream, transformed)
+
+        return transformed
 
     transformation = shanks_transformation(partial_sums)
     print(
         'The Shanks transformation of the partial sums of the Leibniz '
         'sequence:'
     )
-    print(list(transformation[:10]))
+    print(transformation.take(10))
     print()
 
     def make_tableau(transform, stream):
@@ -75,7 +86,7 @@ if __name__ == '__main__':
         'The tableau of successive Shanks transformations of the partial sums '
         'of the Leibniz sequence:'
     )
-    pprint(list(tableau[:10]))
+    pprint(tableau.take(10))
     print()
 
     acceleration = Stream.map(attrgetter('value'), tableau)
@@ -83,7 +94,7 @@ if __name__ == '__main__':
         'The first value of each stream in the tableau of successive Shanks '
         'transformations of the partial sums of the Leibniz sequence:'
     )
-    print(list(acceleration[:10]))
+    print(acceleration.take(10))
     print()
 
     print('The value of the Leibniz series:')
@@ -50,24 +50,31 @@ create an alias for the class (e.g. ``Stream = SinglyLinkedStream``).
 """
 
 from __future__ import annotations
+from array import array
 from collections.abc import (
     Callable,
     Iterable,
     Iterator,
     Reversible,
 )
-from enum import auto, Enum
-from operator import attrgetter
+from itertools import chain, islice, repeat
+from math import prod
+from operator import add, mul
+from reprlib import repr as bounded_repr
 from typing import (
     Any,
     Optional,
     TypeVar,
 )
 
-from .abc import LinearStream
+from .abc import _NO_INITIAL, LinearStream, Stream
 
 __all__ = (
+    'ArrayLinearStream',
+    'Checkpoints',
+    'ChunkedLinearStream',
     'DoublyLinkedStream',
+    'PackedLinearStream',
     'SinglyLinkedStream',
     'thunk_init',
 )
@@ -75,6 +82,41 @@ __all__ = (
 MT = TypeVar('MT')  # type of values after mapping
 VT = TypeVar('VT')  # type of values before or without mapping
 
+_UNSET = object()  # marks a link that has not been memoized
+_MIN_CHECKPOINT_DISTANCE = 64  # shortest walk for which to cache nodes
+_CHUNK_SIZE = 64  # largest number of values per chunk of a chunked stream
+_INTEGER_TYPECODES = frozenset('bBhHiIlLqQ')  # exact under sum and prod
+
+
+def _advanced(node: SinglyLinkedStream, n: int) -> SinglyLinkedStream:
+    """Returns the node that is ``n`` nodes after ``node``.
+
+    :param node: the node from which to start
+
+    :param n: the number of nodes to advance
+    """
+
+    for _ in repeat(None, n):
+        if (next_ := node._next) is _UNSET:
+            next_ = node.next
+
+        if (node := next_) is None:
+            raise IndexError('node index out of range.')
+
+    return node
+
+
+def _linked(node: DoublyLinkedStream) -> DoublyLinkedStream:
+    """Returns ``node`` after binding it to its ``_LinkingThunk``
+    thunks. This allows the adjacent nodes to refer back to ``node``
+    without first being traversed from it.
+    """
+
+    node._next_thunk.node = node
+    node._previous_thunk.node = node
+
+    return node
+
 
 def reversed_node(node: Optional[DoublyLinkedStream]):
     try:
@@ -83,92 +125,1654 @@ def reversed_node(node: Optional[DoublyLinkedStream]):
         return node
 
 
-class TraversalDirection(Enum):
-    NEXT = auto()
-    PREVIOUS = auto()
+def _typecode_of(values: Any) -> str:
+    """Returns the ``array.array`` type code of ``values`` if it is an
+    array or a packed or chunked linear stream. Otherwise, ``'d'`` is
+    returned.
+
+    :param values: the values whose type code to return
+    """
+
+    return getattr(values, 'typecode', 'd')
+
+
+class _Chunk:
+    """A block of consecutive values of a chunked linear stream. The
+    following chunk is read from the iterator when it is first needed.
+    Each chunk is twice as long as the one before it, up to
+    ``_CHUNK_SIZE`` values, so the first values of a stream are
+    available without reading far ahead.
+    """
+
+    __slots__: Iterable[str] = (
+        'data',
+        'iterator',
+        '_next',
+    )
+
+    data: array
+    iterator: Iterator[Any]
+    _next: Optional[_Chunk]
+
+    def __init__(self, data: array, iterator: Iterator[Any]) -> None:
+        """:param data: the values of the chunk
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the following chunks
+        """
+
+        self.data = data
+        self.iterator = iterator
+        self._next = _UNSET
+
+    @classmethod
+    def from_iterator(
+            cls,
+            iterator: Iterator[Any],
+            typecode: str,
+            size: int=1,
+    ) -> Optional[_Chunk]:
+        """Returns a new chunk that contains up to ``size`` values from
+        an iterator or ``None`` if the iterator is exhausted.
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the chunk
+
+        :param typecode: the ``array.array`` type code of the values
+
+        :param size: the largest number of values to read
+        """
+
+        if data := array(typecode, islice(iterator, size)):
+            return cls(data, iterator)
+
+        return None
+
+    @property
+    def next(self) -> Optional[_Chunk]:
+        """Returns the following chunk."""
+
+        if (next_ := self._next) is _UNSET:
+            next_ = self._next = self.from_iterator(
+                self.iterator,
+                self.data.typecode,
+                min(2 * len(self.data), _CHUNK_SIZE),
+            )
+            del self.iterator
+
+        return next_
+
+
+class _FilterThunk:
+    """A thunk that returns the filtered stream that follows a node."""
+
+    __slots__: Iterable[str] = (
+        'node',
+        'predicate',
+    )
+
+    node: SinglyLinkedStream
+    predicate: Callable[[Any], bool]
+
+    def __init__(
+            self,
+            node: SinglyLinkedStream,
+            predicate: Callable[[Any], bool],
+    ) -> None:
+        """:param node: the node whose successors are to be filtered
+
+        :param predicate: the function to apply to the values in the
+            stream
+        """
+
+        self.node = node
+        self.predicate = predicate
+
+    def __call__(self) -> Optional[SinglyLinkedStream]:
+        """Returns the next node that satisfies the predicate."""
+
+        return self.node.next.filter(self.predicate)
+
+
+class _IteratorThunk:
+    """A thunk that returns a node that contains the next value of an
+    iterator. Since the iterator is consumed in order regardless, every
+    node of the resulting stream shares a single instance.
+    """
+
+    __slots__: Iterable[str] = (
+        'cls',
+        'iterator',
+        'does_memoize',
+    )
+
+    cls: type[SinglyLinkedStream]
+    iterator: Iterator[Any]
+    does_memoize: bool
+
+    def __init__(
+            self,
+            cls: type[SinglyLinkedStream],
+            iterator: Iterator[Any],
+            does_memoize: bool,
+    ) -> None:
+        """:param cls: the stream class of which to create the nodes
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        self.cls = cls
+        self.iterator = iterator
+        self.does_memoize = does_memoize
+
+    def __call__(self) -> Optional[SinglyLinkedStream]:
+        """Returns a node that contains the next value of the iterator
+        or ``None`` if the iterator is exhausted.
+        """
+
+        try:
+            value = next(self.iterator)
+        except StopIteration:
+            return None
+
+        return self.cls(value, self, does_memoize=self.does_memoize)
+
+
+class _DoublyIteratorThunk(_IteratorThunk):
+    """A thunk that returns a doubly linked node that contains the next
+    value of an iterator. Like ``_IteratorThunk``, every node of the
+    resulting stream shares a single instance, which remembers the
+    thunk that returns the most recently created node so that the next
+    node can link back to it.
+    """
+
+    __slots__: Iterable[str] = (
+        'previous_thunk',
+    )
+
+    previous_thunk: Callable[[], Optional[DoublyLinkedStream]]
+
+    def __init__(
+            self,
+            cls: type[DoublyLinkedStream],
+            iterator: Iterator[Any],
+            does_memoize: bool,
+            previous_thunk: Callable[[], Optional[DoublyLinkedStream]],
+    ) -> None:
+        """:param cls: the stream class of which to create the nodes
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+
+        :param previous_thunk: a zero-argument function that should
+            return the node that precedes the first node
+        """
+
+        super().__init__(cls, iterator, does_memoize)
+        self.previous_thunk = previous_thunk
+
+    def __call__(self) -> Optional[DoublyLinkedStream]:
+        """Returns a node that contains the next value of the iterator
+        or ``None`` if the iterator is exhausted.
+        """
+
+        try:
+            value = next(self.iterator)
+        except StopIteration:
+            return None
+
+        node = self.cls(
+            value,
+            self,
+            self.previous_thunk,
+            does_memoize=self.does_memoize,
+        )
+        self.previous_thunk = lambda: node
+
+        return node
+
+
+class _LimitedIterator:
+    """An iterator that yields exactly ``n`` values from another
+    iterator. If the other iterator is exhausted first, then
+    ``IndexError`` is raised, as it is when a limited linked stream
+    runs out of nodes.
+    """
+
+    __slots__: Iterable[str] = (
+        'iterator',
+        'n',
+    )
+
+    iterator: Iterator[Any]
+    n: int
+
+    def __init__(self, iterator: Iterator[Any], n: int) -> None:
+        """:param iterator: the iterator from which to retrieve the
+            values
+
+        :param n: the number of values to yield
+        """
+
+        self.iterator = iterator
+        self.n = n
+
+    def __iter__(self) -> _LimitedIterator:
+        """Returns the iterator itself."""
+
+        return self
+
+    def __next__(self) -> Any:
+        """Returns the next value of the other iterator."""
+
+        if self.n == 0:
+            raise StopIteration
+
+        try:
+            value = next(self.iterator)
+        except StopIteration:
+            raise IndexError('node index out of range.') from None
+
+        self.n -= 1
+
+        return value
+
+
+class _LinkingThunk:
+    """A thunk that links the node that it returns back to the node that
+    it belongs to. See ``_linked`` for more information.
+    """
+
+    __slots__: Iterable[str] = (
+        'thunk',
+        'slot',
+        'node',
+    )
+
+    thunk: Callable[[], Optional[DoublyLinkedStream]]
+    slot: str
+    node: DoublyLinkedStream
+
+    def __init__(
+            self,
+            thunk: Callable[[], Optional[DoublyLinkedStream]],
+            slot: str,
+    ) -> None:
+        """:param thunk: the zero-argument function that returns the
+            adjacent node
+
+        :param slot: the name of the slot of the adjacent node that
+            should refer back to the node
+        """
+
+        self.thunk = thunk
+        self.slot = slot
+
+    def __call__(self) -> Optional[DoublyLinkedStream]:
+        """Returns the adjacent node after linking it back to the node.
+        """
+
+        if (adjacent := self.thunk()) is not None:
+            setattr(adjacent, self.slot, self.node)
+
+        return adjacent
+
+
+class _Map1Thunk:
+    """A thunk that returns the node that follows a node returned by
+    ``SinglyLinkedStream._map1``.
+    """
+
+    __slots__: Iterable[str] = (
+        'cls',
+        'fn',
+        'stream',
+        'does_memoize',
+    )
+
+    cls: type[SinglyLinkedStream]
+    fn: Callable[[Any], Any]
+    stream: SinglyLinkedStream
+    does_memoize: bool
+
+    def __init__(
+            self,
+            cls: type[SinglyLinkedStream],
+            fn: Callable[[Any], Any],
+            stream: SinglyLinkedStream,
+            does_memoize: bool,
+    ) -> None:
+        """:param cls: the stream class of which to create the node
+
+        :param fn: the function to be applied to each value in the
+            stream
+
+        :param stream: the stream whose successor contains the value to
+            be mapped
+
+        :param does_memoize: whether the node should cache the result
+            of its thunk
+        """
+
+        self.cls = cls
+        self.fn = fn
+        self.stream = stream
+        self.does_memoize = does_memoize
+
+    def __call__(self) -> SinglyLinkedStream:
+        """Returns the node that contains the mapped value of the
+        successor of the stream.
+        """
+
+        if (cls := self.cls)._maps_directly:
+            return cls._map1(self.fn, self.stream.next, self.does_memoize)
+
+        return cls.map(
+            self.fn,
+            self.stream.next,
+            does_memoize=self.does_memoize,
+        )
+
+
+class _Map2Thunk:
+    """A thunk that returns the node that follows a node returned by
+    ``SinglyLinkedStream._map2``.
+    """
+
+    __slots__: Iterable[str] = (
+        'cls',
+        'fn',
+        'stream_1',
+        'stream_2',
+        'does_memoize',
+    )
+
+    cls: type[SinglyLinkedStream]
+    fn: Callable[[Any, Any], Any]
+    stream_1: SinglyLinkedStream
+    stream_2: SinglyLinkedStream
+    does_memoize: bool
+
+    def __init__(
+            self,
+            cls: type[SinglyLinkedStream],
+            fn: Callable[[Any, Any], Any],
+            stream_1: SinglyLinkedStream,
+            stream_2: SinglyLinkedStream,
+            does_memoize: bool,
+    ) -> None:
+        """:param cls: the stream class of which to create the node
+
+        :param fn: the function to be applied to each pair of values in
+            the streams
+
+        :param stream_1: the stream whose successor contains the first
+            argument to be mapped
+
+        :param stream_2: the stream whose successor contains the second
+            argument to be mapped
+
+        :param does_memoize: whether the node should cache the result
+            of its thunk
+        """
+
+        self.cls = cls
+        self.fn = fn
+        self.stream_1 = stream_1
+        self.stream_2 = stream_2
+        self.does_memoize = does_memoize
+
+    def __call__(self) -> SinglyLinkedStream:
+        """Returns the node that contains the mapped values of the
+        successors of the streams.
+        """
+
+        if (cls := self.cls)._maps_directly:
+            return cls._map2(
+                self.fn,
+                self.stream_1.next,
+                self.stream_2.next,
+                self.does_memoize,
+            )
+
+        return cls.map(
+            self.fn,
+            self.stream_1.next,
+            self.stream_2.next,
+            does_memoize=self.does_memoize,
+        )
+
+
+class _MapThunk:
+    """A thunk that returns the mapped stream that follows a node."""
+
+    __slots__: Iterable[str] = (
+        'cls',
+        'fn',
+        'streams',
+        'does_memoize',
+    )
+
+    cls: type[SinglyLinkedStream]
+    fn: Callable[..., Any]
+    streams: tuple[SinglyLinkedStream, ...]
+    does_memoize: bool
+
+    def __init__(
+            self,
+            cls: type[SinglyLinkedStream],
+            fn: Callable[..., Any],
+            streams: tuple[SinglyLinkedStream, ...],
+            does_memoize: bool,
+    ) -> None:
+        """:param cls: the stream class of which to create the node
+
+        :param fn: the function to be applied to each value in the
+            stream
+
+        :param streams: the tuple of streams whose successors contain
+            the values to be mapped
+
+        :param does_memoize: whether the node should cache the result
+            of its thunk
+        """
+
+        self.cls = cls
+        self.fn = fn
+        self.streams = streams
+        self.does_memoize = does_memoize
+
+    def __call__(self) -> SinglyLinkedStream:
+        """Returns the node that contains the mapped values of the
+        successors of the streams.
+        """
+
+        return self.cls.map(
+            self.fn,
+            *[stream.next for stream in self.streams],
+            does_memoize=self.does_memoize,
+        )
+
+
+class _ScannerThunk:
+    """A thunk that returns the node that follows a node returned by
+    ``SinglyLinkedStream._scanner``.
+    """
+
+    __slots__: Iterable[str] = (
+        'cls',
+        'fn',
+        'value',
+        'stream',
+        'does_memoize',
+    )
+
+    cls: type[SinglyLinkedStream]
+    fn: Callable[[Any, Any], Any]
+    value: Any
+    stream: SinglyLinkedStream
+    does_memoize: bool
+
+    def __init__(
+            self,
+            cls: type[SinglyLinkedStream],
+            fn: Callable[[Any, Any], Any],
+            value: Any,
+            stream: SinglyLinkedStream,
+            does_memoize: bool,
+    ) -> None:
+        """:param cls: the stream class of which to create the node
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param value: the result accumulated up to and including
+            ``stream``
+
+        :param stream: the node whose value was last accumulated
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        self.cls = cls
+        self.fn = fn
+        self.value = value
+        self.stream = stream
+        self.does_memoize = does_memoize
+
+    def __call__(self) -> Optional[SinglyLinkedStream]:
+        """Returns the node that contains the next accumulated value."""
+
+        return self.cls._scanner_next(
+            self.fn,
+            self.value,
+            self.stream,
+            self.does_memoize,
+        )
+
+
+class _SlicerThunk:
+    """A thunk that returns the limited and stepped stream that follows
+    a node.
+    """
+
+    __slots__: Iterable[str] = (
+        'node',
+        'n',
+        'step',
+    )
+
+    node: SinglyLinkedStream
+    n: int
+    step: int
+
+    def __init__(self, node: SinglyLinkedStream, n: int, step: int) -> None:
+        """:param node: the node whose successors are to be sliced
+
+        :param n: the number of nodes to which the stream starting at
+            ``node`` is limited before stepping
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        self.node = node
+        self.n = n
+        self.step = step
+
+    def __call__(self) -> Optional[SinglyLinkedStream]:
+        """Returns the next node of the sliced stream."""
+
+        return self.node._slicer_next(self.n, self.step)
+
+
+class _StopperThunk:
+    """A thunk that returns the limited stream that follows a node."""
+
+    __slots__: Iterable[str] = (
+        'node',
+        'n',
+    )
+
+    node: SinglyLinkedStream
+    n: int
+
+    def __init__(self, node: SinglyLinkedStream, n: int) -> None:
+        """:param node: the node whose successors are to be limited
+
+        :param n: the number of nodes to which the stream starting at
+            ``node`` is limited
+        """
+
+        self.node = node
+        self.n = n
+
+    def __call__(self) -> Optional[SinglyLinkedStream]:
+        """Returns the next node of the limited stream."""
+
+        return self.node._stopper_next(self.n)
+
+
+class SinglyLinkedStream(LinearStream[VT]):
+    """A singly linked list class implemented as a stream."""
+
+    __slots__: Iterable[str] = (
+        'does_memoize',
+        '_value',
+        '_next',
+        '_next_thunk',
+    )
+
+    does_memoize: bool
+    _value: VT
+    _next: Optional[SinglyLinkedStream[VT]]
+    _next_thunk: Callable[[], Optional[SinglyLinkedStream[VT]]]
+
+    # whether ``map`` is inherited, so that mapped streams can create
+    # their following nodes without dispatching through it
+    _maps_directly: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Records whether the subclass overrides ``map``. If it does,
+        every node of a mapped stream is created through the override,
+        not only the first.
+        """
+
+        super().__init_subclass__(**kwargs)
+        cls._maps_directly = (
+            getattr(cls.map, '__func__', None)
+            is SinglyLinkedStream.map.__func__
+        )
+
+    def __init__(
+            self,
+            value: VT,
+            next_thunk: Callable[[], Optional[SinglyLinkedStream[VT]]],
+            *,
+            does_memoize: bool=True
+    ) -> None:
+        """:param value: the value of the stream node.
+
+        :param next_thunk: a zero-argument function that should return
+            the following node
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+
+        Changing any of these values after initialization might cause
+        unexpected results.
+        """
+
+        self._value = value
+        self._next = _UNSET
+        self._next_thunk = next_thunk
+        self.does_memoize = does_memoize
+
+    def __contains__(self, value: VT) -> bool:
+        """Determines whether ``value`` is in the stream. Use with
+        caution as this will not terminate if the stream is infinite.
+
+        :param value: the value for which to search
+        """
+
+        return value in iter(self)
+
+    def __iter__(self) -> Iterator[VT]:
+        """Returns an iterator that yields the values from the stream.
+        """
+
+        node = self
+
+        while node is not None:
+            yield node._value
+
+            if (next_ := node._next) is _UNSET:
+                next_ = node.next
+
+            node = next_
+
+    def __repr__(self) -> str:
+        """Returns the canonical string representation of the stream
+        node. To keep it short, large values are abbreviated.
+        """
+
+        return '{}({}, {}, does_memoize={})'.format(
+            self.__class__.__name__,
+            bounded_repr(self._value),
+            repr(self._next_thunk),
+            repr(self.does_memoize),
+        )
+
+    @property
+    def next(self) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns the next node."""
+
+        if (next_ := self._next) is _UNSET:
+            next_ = self._next_thunk()
+
+            if self.does_memoize:
+                self._next = next_
+
+        return next_
+
+    @property
+    def value(self) -> VT:
+        """Returns the value of the node."""
+
+        return self._value
+
+    @value.setter
+    def value(self, value: VT) -> None:
+        """Sets the value of the node.
+
+        :param value: the value to set
+        """
+
+        self._value = value
+
+    def filter(
+            self,
+            predicate: Callable[[VT], bool]=None,
+    ) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns a new stream that filters out the values that do not
+        satisfy the predicate.
+
+        :param predicate: the function to apply to the values in the
+            stream. It defaults to testing each value itself for
+            validity.
+        """
+
+        if predicate is None:
+            def predicate(value):
+                return bool(value)
+
+        node = self
+
+        while not predicate(node._value):
+            if (next_ := node._next) is _UNSET:
+                next_ = node.next
+
+            if (node := next_) is None:
+                return node
+
+        return self.__class__(
+            node._value,
+            _FilterThunk(node, predicate),
+            does_memoize=node.does_memoize,
+        )
+
+    @classmethod
+    def map(
+            cls,
+            fn: Callable[..., MT],
+            *streams: SinglyLinkedStream,
+            does_memoize: bool=True
+    ) -> SinglyLinkedStream[MT]:
+        """Returns a new stream that contains the return values of the
+        function applied to each item in the streams.
+
+        :param fn: the function to be applied to each value in the
+            stream
+
+        :param streams: the tuple of streams that contain the values to
+            be mapped
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+        """
+
+        if len(streams) == 1:
+            return cls._map1(fn, *streams, does_memoize)
+
+        if len(streams) == 2:
+            return cls._map2(fn, *streams, does_memoize)
+
+        # Stream nodes in this module all store their values in the
+        # ``_value`` slot, so it is read directly rather than through
+        # the ``value`` property.
+        return cls(
+            fn(*[stream._value for stream in streams]),
+            _MapThunk(cls, fn, streams, does_memoize),
+            does_memoize=does_memoize,
+        )
+
+    @classmethod
+    def scan(
+            cls,
+            fn: Callable[[VT, VT], VT],
+            stream: SinglyLinkedStream[VT],
+            does_memoize: bool=True
+    ) -> SinglyLinkedStream[VT]:
+        """Returns a new stream that contains the running results of
+        applying the function to the values in the stream. The first
+        value is the value of ``stream``, and every following value is
+        the return value of the function applied to the preceding
+        result and the next value in ``stream``. For example,
+        ``scan(add, stream)`` contains the partial sums of ``stream``.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param stream: the stream that contains the values to be
+            accumulated
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+        """
+
+        return cls._scanner(fn, stream._value, stream, does_memoize)
+
+    @classmethod
+    def _map1(
+            cls,
+            fn: Callable[[VT], MT],
+            stream: SinglyLinkedStream[VT],
+            does_memoize: bool,
+    ) -> SinglyLinkedStream[MT]:
+        """Returns a new stream that contains the return values of the
+        function applied to each item in the stream. This is equivalent
+        to ``map`` with a single stream.
+
+        :param fn: the function to be applied to each value in the
+            stream
+
+        :param stream: the stream that contains the values to be mapped
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        return cls(
+            fn(stream._value),
+            _Map1Thunk(cls, fn, stream, does_memoize),
+            does_memoize=does_memoize,
+        )
+
+    @classmethod
+    def _map2(
+            cls,
+            fn: Callable[[Any, Any], MT],
+            stream_1: SinglyLinkedStream,
+            stream_2: SinglyLinkedStream,
+            does_memoize: bool,
+    ) -> SinglyLinkedStream[MT]:
+        """Returns a new stream that contains the return values of the
+        function applied to each pair of items in the streams. This is
+        equivalent to ``map`` with two streams.
+
+        :param fn: the function to be applied to each pair of values in
+            the streams
+
+        :param stream_1: the stream that contains the first arguments
+            to be mapped
+
+        :param stream_2: the stream that contains the second arguments
+            to be mapped
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        return cls(
+            fn(stream_1._value, stream_2._value),
+            _Map2Thunk(cls, fn, stream_1, stream_2, does_memoize),
+            does_memoize=does_memoize,
+        )
+
+    @classmethod
+    def _scanner(
+            cls,
+            fn: Callable[[VT, VT], VT],
+            value: VT,
+            stream: SinglyLinkedStream[VT],
+            does_memoize: bool,
+    ) -> SinglyLinkedStream[VT]:
+        """Returns a new stream whose first value is ``value`` and whose
+        following values accumulate the values that follow ``stream``.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param value: the result accumulated up to and including
+            ``stream``
+
+        :param stream: the node whose value was last accumulated
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        return cls(
+            value,
+            _ScannerThunk(cls, fn, value, stream, does_memoize),
+            does_memoize=does_memoize,
+        )
+
+    @classmethod
+    def _scanner_next(
+            cls,
+            fn: Callable[[VT, VT], VT],
+            value: VT,
+            stream: SinglyLinkedStream[VT],
+            does_memoize: bool,
+    ) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns the node that follows a node returned by
+        ``_scanner``.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param value: the result accumulated up to and including
+            ``stream``
+
+        :param stream: the node whose value was last accumulated
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        if (next_ := stream.next) is None:
+            return None
+
+        return cls._scanner(
+            fn,
+            fn(value, next_._value),
+            next_,
+            does_memoize,
+        )
+
+    def _slicer(
+            self,
+            n: int,
+            step: int,
+    ) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes and that
+        skips every ``step - 1`` nodes. Unlike stepping over a stream
+        returned by ``_stopper``, this creates one node per value.
+
+        :param n: the number of nodes to which to limit the stream
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        if step == 1:
+            return self._stopper(n)
+
+        return None if n == 0 else self.__class__(
+            self._value,
+            _SlicerThunk(self, n, step),
+            does_memoize=self.does_memoize,
+        )
+
+    def _slicer_next(
+            self,
+            n: int,
+            step: int,
+    ) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns the node that follows ``self`` in a stream returned
+        by ``_slicer``.
+
+        :param n: the number of nodes to which the stream starting at
+            ``self`` is limited
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        if n <= step:
+            return None
+
+        try:
+            node = self._starter(step)
+        except IndexError:
+            return None
+
+        return node._slicer(n - step, step)
+
+    def _starter(self, n: int) -> SinglyLinkedStream[VT]:
+        """Returns the node that is ``n`` nodes away from ``self``.
+
+        :param n: the number of nodes away to start from ``self``
+        """
+
+        return _advanced(self, n)
+
+    def _stepper(self, n: int) -> SinglyLinkedStream[VT]:
+        """Returns a new stream that skips every ``n - 1`` nodes.
+
+        :param n: the number of nodes to skip between nodes
+        """
+
+        if n < 1:
+            raise ValueError(f'step must be positive integer, not {n}')
+
+        if n == 1:
+            return self
+
+        return self.__class__(
+            self._value,
+            lambda: self._stepper_next(n),
+            does_memoize=self.does_memoize,
+        )
+
+    def _stepper_next(self, n: int) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns the node that follows ``self`` in a stream returned
+        by ``_stepper``.
+
+        :param n: the number of nodes to skip between nodes
+        """
+
+        try:
+            node = self._starter(n)
+        except IndexError:
+            return None
+
+        return node._stepper(n)
+
+    def _stopper(self, n: int) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes.
+
+        :param n: the number of nodes to which to limit the stream
+        """
+
+        return None if n == 0 else self.__class__(
+            self._value,
+            _StopperThunk(self, n),
+            does_memoize=self.does_memoize,
+        )
+
+    def _stopper_next(self, n: int) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns the node that follows ``self`` in a stream returned
+        by ``_stopper``.
+
+        :param n: the number of nodes to which the stream starting at
+            ``self`` is limited
+        """
+
+        if (next_ := self._next) is _UNSET:
+            next_ = self.next
+
+        if next_ is None:
+            if n > 1:
+                raise IndexError('node index out of range.')
+
+            return None
+
+        return next_._stopper(n - 1)
+
+    @classmethod
+    def _from_iterator(
+            cls,
+            iterator: Iterator[VT],
+            does_memoize: bool=True,
+    ) -> Optional[SinglyLinkedStream[VT]]:
+        """Returns a new stream that contains data from an iterator. Use
+        of the iterator elsewhere afterward is generally inadvisable.
+        Otherwise, the stream might become out of sync.
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+        """
+
+        return _IteratorThunk(cls, iterator, does_memoize)()
+
+
+class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
+    """A doubly linked list class implemented as a stream."""
+
+    __slots__: Iterable[str] = (
+        '_previous',
+        '_previous_thunk',
+    )
+
+    _previous: Optional[DoublyLinkedStream[VT]]
+    _previous_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]]
+
+    def __init__(
+            self,
+            value: VT,
+            next_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]],
+            previous_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]]=None,
+            *,
+            does_memoize: bool=True
+    ) -> None:
+        """:param value: the value of the stream node
+
+        :param next_thunk: a zero-argument function that should return
+            the following node
+
+        :param previous_thunk is a zero-argument function that should
+            return the preceding node. It defaults to behaving similarly
+            to singly linked nodes.
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+
+        Changing any of these values after initialization might cause
+        unexpected results.
+        """
+
+        super().__init__(value, next_thunk, does_memoize=does_memoize)
+
+        if previous_thunk is None:
+            def previous_thunk():
+                return None
+
+        self._previous = _UNSET
+        self._previous_thunk = previous_thunk
+
+    def __contains__(self, value: VT) -> bool:
+        """Determines whether ``value`` is in the stream. Use with
+        caution as this will not terminate if the stream is infinite.
+
+        :param value: the value for which to search
+        """
+
+        if value in iter(self):
+            return True
+
+        node = self
+
+        while True:
+            if (previous := node._previous) is _UNSET:
+                previous = node.previous
+
+            if (node := previous) is None:
+                return False
+
+            if (item := node._value) is value or item == value:
+                return True
+
+    def __repr__(self) -> str:
+        """Returns the canonical string representation of the node. To
+        keep it short, large values are abbreviated.
+        """
+
+        return '{}({}, {}, {}, does_memoize={})'.format(
+            self.__class__.__name__,
+            bounded_repr(self._value),
+            repr(self._next_thunk),
+            repr(self._previous_thunk),
+            repr(self.does_memoize)
+        )
+
+    def __reversed__(self) -> DoublyLinkedStream[VT]:
+        """Returns the stream in reverse."""
+
+        if self.does_memoize:
+            return _linked(self.__class__(
+                self._value,
+                _LinkingThunk(
+                    lambda: reversed_node(self.previous),
+                    '_previous',
+                ),
+                _LinkingThunk(
+                    lambda: reversed_node(self.next),
+                    '_next',
+                ),
+                does_memoize=True,
+            ))
+
+        return self.__class__(
+            self._value,
+            lambda: reversed_node(self.previous),
+            lambda: reversed_node(self.next),
+            does_memoize=False,
+        )
+
+    @property
+    def next(self) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns the next node."""
+
+        if (next_ := self._next) is _UNSET:
+            next_ = self._next_thunk()
+
+            if self.does_memoize:
+                self._next = next_
+
+        return next_
+
+    @property
+    def previous(self) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns the previous node."""
+
+        if (previous := self._previous) is _UNSET:
+            previous = self._previous_thunk()
+
+            if self.does_memoize:
+                self._previous = previous
+
+        return previous
+
+    @property
+    def value(self) -> VT:
+        """Returns the value of the node."""
+
+        return self._value
+
+    @value.setter
+    def value(self, value: VT) -> None:
+        """Sets the value of the node.
+
+        :param value: the value to set
+        """
+
+        self._value = value
+
+    def filter(
+            self,
+            predicate: Callable[[VT], bool]=None,
+    ) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that filters out the values that do not
+        satisfy the predicate.
+
+        :param predicate: the function to apply to the values in the
+            stream. It defaults to testing each value itself for
+            validity.
+        """
+
+        if predicate is None:
+            def predicate(value):
+                return value
+
+        return self._filter_forward(predicate)
+
+    @classmethod
+    def map(
+            cls,
+            fn: Callable[..., MT],
+            *streams: DoublyLinkedStream,
+            does_memoize: bool=True
+    ) -> DoublyLinkedStream[MT]:
+        """Returns a new stream that contains the return values of the
+        function applied to each item in the streams.
+
+        :param fn: the function to be applied to each value in the
+            stream
+
+        :param streams: the tuple of streams that contain the values to
+            be mapped
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+        """
+
+        if does_memoize:
+            return _linked(cls(
+                fn(*[stream._value for stream in streams]),
+                _LinkingThunk(
+                    lambda: cls.map(
+                        fn,
+                        *[stream.next for stream in streams],
+                        does_memoize=True,
+                    ),
+                    '_previous',
+                ),
+                _LinkingThunk(
+                    lambda: cls.map(
+                        fn,
+                        *[stream.previous for stream in streams],
+                        does_memoize=True,
+                    ),
+                    '_next',
+                ),
+                does_memoize=True,
+            ))
+
+        return cls(
+            fn(*[stream._value for stream in streams]),
+            lambda: cls.map(
+                fn,
+                *[stream.next for stream in streams],
+                does_memoize=False,
+            ),
+            lambda: cls.map(
+                fn,
+                *[stream.previous for stream in streams],
+                does_memoize=False,
+            ),
+            does_memoize=False,
+        )
+
+    def _filter_backward(
+            self,
+            predicate: Callable[[VT], bool],
+    ) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that filters out the values that do not
+        satisfy the predicate, starting from the nearest node at or
+        before ``self`` that satisfies it.
+
+        :param predicate: the function to apply to the values in the
+            stream
+        """
+
+        node = self
+
+        while not predicate(node._value):
+            if (previous := node._previous) is _UNSET:
+                previous = node.previous
+
+            if (node := previous) is None:
+                return None
+
+        return node._filtered(predicate)
+
+    def _filter_forward(
+            self,
+            predicate: Callable[[VT], bool],
+    ) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that filters out the values that do not
+        satisfy the predicate, starting from the nearest node at or
+        after ``self`` that satisfies it.
+
+        :param predicate: the function to apply to the values in the
+            stream
+        """
+
+        node = self
+
+        while not predicate(node._value):
+            if (next_ := node._next) is _UNSET:
+                next_ = node.next
+
+            if (node := next_) is None:
+                return None
+
+        return node._filtered(predicate)
+
+    def _filtered(
+            self,
+            predicate: Callable[[VT], bool],
+    ) -> DoublyLinkedStream[VT]:
+        """Returns a new node with the value of ``self`` whose adjacent
+        nodes are the nearest nodes on either side that satisfy the
+        predicate.
+
+        :param predicate: the function to apply to the values in the
+            stream
+        """
+
+        if self.does_memoize:
+            return _linked(self.__class__(
+                self._value,
+                _LinkingThunk(
+                    lambda: self.next._filter_forward(predicate),
+                    '_previous',
+                ),
+                _LinkingThunk(
+                    lambda: self.previous._filter_backward(predicate),
+                    '_next',
+                ),
+                does_memoize=True,
+            ))
+
+        return self.__class__(
+            self._value,
+            lambda: self.next._filter_forward(predicate),
+            lambda: self.previous._filter_backward(predicate),
+            does_memoize=False,
+        )
+
+    @classmethod
+    def _from_iterator(
+            cls,
+            iterator: Iterator[VT],
+            does_memoize: bool=True,
+            previous_thunk: Callable[
+                [],
+                Optional[DoublyLinkedStream[VT]],
+            ]=None,
+    ) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that contains data from an iterator. Use
+        of the iterator elsewhere afterward is generally inadvisable.
+        Otherwise, the stream might become out of sync.
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: By default, the node will cache the result
+            of ``next_thunk``. This can potentially hog a lot of memory.
+            To turn caching off, set ``does_memoize`` to ``False``. It
+            might be desirable to propagate this to composite streams
+            generated by custom functions.
+
+        :param previous_thunk: a zero-argument function that should
+            return the preceding node. It defaults to behaving similarly
+            to singly linked nodes.
+        """
+
+        if previous_thunk is None:
+            def previous_thunk():
+                return None
+
+        return _DoublyIteratorThunk(
+            cls,
+            iterator,
+            does_memoize,
+            previous_thunk,
+        )()
+
+    @classmethod
+    def _scanner(
+            cls,
+            fn: Callable[[VT, VT], VT],
+            value: VT,
+            stream: SinglyLinkedStream[VT],
+            does_memoize: bool,
+    ) -> DoublyLinkedStream[VT]:
+        """Returns a new stream whose first value is ``value`` and whose
+        following values accumulate the values that follow ``stream``.
+        Each following node links back to the node that produced it, so
+        the stream can be traversed backward as far as its first node,
+        which has no preceding node.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param value: the result accumulated up to and including
+            ``stream``
+
+        :param stream: the node whose value was last accumulated
+
+        :param does_memoize: whether the nodes should cache the results
+            of their thunks
+        """
+
+        next_thunk = _LinkingThunk(
+            _ScannerThunk(cls, fn, value, stream, does_memoize),
+            '_previous',
+        )
+        next_thunk.node = node = cls(
+            value,
+            next_thunk,
+            does_memoize=does_memoize,
+        )
+
+        return node
+
+    def _slicer(
+            self,
+            n: int,
+            step: int,
+    ) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes and that
+        skips every ``step - 1`` nodes. This composes ``_stopper`` and
+        ``_stepper`` so that the preceding nodes remain reachable.
+
+        :param n: the number of nodes to which to limit the stream
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        return LinearStream._slicer(self, n, step)
+
+    def _starter(self, n: int) -> DoublyLinkedStream[VT]:
+        """Returns the node that is ``n`` nodes away from ``self``.
+
+        :param n: the number of nodes away to start from ``self``
+        """
+
+        if n >= 0:
+            return super()._starter(n)
+
+        node = self
+
+        for _ in repeat(None, -n):
+            if (previous := node._previous) is _UNSET:
+                previous = node.previous
+
+            if (node := previous) is None:
+                raise IndexError('node index out of range.')
+
+        return node
+
+    def _stepper(self, n: int) -> DoublyLinkedStream[VT]:
+        """Returns a new stream that skips every ``n - 1`` nodes.
+
+        :param n: the number of nodes to skip between nodes
+        """
+
+        if n < 1:
+            raise ValueError(f'step must be positive integer, not {n}')
 
+        if n == 1:
+            return self
 
-class SinglyLinkedStream(LinearStream[VT]):
-    """A singly linked list class implemented as a stream."""
+        if self.does_memoize:
+            return _linked(self.__class__(
+                self._value,
+                _LinkingThunk(
+                    lambda: self._stepper_next(n),
+                    '_previous',
+                ),
+                _LinkingThunk(
+                    lambda: self._stepper_previous(n),
+                    '_next',
+                ),
+                does_memoize=self.does_memoize,
+            ))
+
+        return self.__class__(
+            self._value,
+            lambda: self._stepper_next(n),
+            lambda: self._stepper_previous(n),
+            does_memoize=self.does_memoize,
+        )
+
+    def _stepper_previous(self, n: int) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns the node that precedes ``self`` in a stream returned
+        by ``_stepper``.
+
+        :param n: the number of nodes to skip between nodes
+        """
+
+        try:
+            node = self._starter(-n)
+        except IndexError:
+            return None
+
+        return node._stepper(n)
+
+    def _stopper(self, n: int) -> Optional[DoublyLinkedStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes.
+
+        :param n: the number of nodes to which to limit the stream
+        """
+
+        if n == 0:
+            return None
+
+        if self.does_memoize:
+            return _linked(self.__class__(
+                self._value,
+                _LinkingThunk(_StopperThunk(self, n), '_previous'),
+                _LinkingThunk(
+                    lambda: self.previous._stopper(n + 1),
+                    '_next',
+                ),
+                does_memoize=True,
+            ))
+
+        return self.__class__(
+            self._value,
+            _StopperThunk(self, n),
+            lambda: self.previous._stopper(n + 1),
+            does_memoize=False,
+        )
+
+
+class ArrayLinearStream(LinearStream[VT]):
+    """A linear stream whose values are stored contiguously in a list.
+    Each node is a lightweight view of one position in the list, so
+    traversing, indexing, and slicing do not chase links from node to
+    node. Unlike the linked streams, array linear streams are finite
+    and their values are computed eagerly. Slices that are limited or
+    stepped copy the values that they select.
+    """
 
     __slots__: Iterable[str] = (
-        'does_memoize',
-        '_value',
-        '_next',
-        '_next_thunk',
+        '_data',
+        '_index',
     )
 
-    does_memoize: bool
-    _value: VT
-    _next: Optional[SinglyLinkedStream[VT]]
-    _next_thunk: Callable[[], Optional[SinglyLinkedStream[VT]]]
-
-    def __init__(
-            self,
-            value: VT,
-            next_thunk: Callable[[], Optional[SinglyLinkedStream[VT]]],
-            *,
-            does_memoize: bool=True
-    ) -> None:
-        """:param value: the value of the stream node.
+    _data: list[VT]
+    _index: int
 
-        :param next_thunk: a zero-argument function that should return
-            the following node
+    def __init__(self, data: list[VT], index: int=0) -> None:
+        """:param data: the nonempty list that contains the values of
+            the stream. It is shared, not copied, so changes to it are
+            reflected by the stream and vice versa.
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
+        :param index: the position in ``data`` of the value of the node
 
         Changing any of these values after initialization might cause
         unexpected results.
         """
 
-        self._value = value
-        self._next_thunk = next_thunk
-        self.does_memoize = does_memoize
+        self._data = data
+        self._index = index
 
     def __contains__(self, value: VT) -> bool:
-        """Determines whether ``value`` is in the stream. Use with
-        caution as this will not terminate if the stream is infinite.
+        """Determines whether ``value`` is in the stream.
 
         :param value: the value for which to search
         """
 
-        return value in iter(self)
+        if self._index == 0:
+            return value in self._data
+
+        return value in islice(self._data, self._index, None)
+
+    def __iter__(self) -> Iterator[VT]:
+        """Returns an iterator that yields the values from the stream.
+        """
+
+        if self._index == 0:
+            return iter(self._data)
+
+        return islice(self._data, self._index, None)
+
+    def __length_hint__(self) -> int:
+        """Returns the number of nodes in the stream. This lets ``list``
+        and similar consumers allocate their storage once.
+        """
+
+        return len(self._data) - self._index
 
     def __repr__(self) -> str:
         """Returns the canonical string representation of the stream
-        node.
+        node. To keep it short, long buffers are abbreviated.
         """
 
-        return '{}({}, {}, does_memoize={})'.format(
+        return '{}({}, {})'.format(
             self.__class__.__name__,
-            repr(self._value),
-            repr(self._next_thunk),
-            repr(self.does_memoize),
+            bounded_repr(self._data),
+            repr(self._index),
         )
 
     @property
-    def next(self) -> Optional[SinglyLinkedStream[VT]]:
-        """Returns the next node."""
-
-        try:
-            return self._next
-        except AttributeError:
-            next_ = self._next_thunk()
+    def next(self) -> Optional[ArrayLinearStream[VT]]:
+        """Returns the next node. Since nodes are views, a new node is
+        returned every time.
+        """
 
-            if self.does_memoize:
-                self._next = next_
+        if (index := self._index + 1) == len(self._data):
+            return None
 
-            return next_
+        return self.__class__(self._data, index)
 
     @property
     def value(self) -> VT:
         """Returns the value of the node."""
 
-        return self._value
+        return self._data[self._index]
 
     @value.setter
     def value(self, value: VT) -> None:
@@ -177,12 +1781,12 @@ class SinglyLinkedStream(LinearStream[VT]):
         :param value: the value to set
         """
 
-        self._value = value
+        self._data[self._index] = value
 
     def filter(
             self,
             predicate: Callable[[VT], bool]=None,
-    ) -> Optional[SinglyLinkedStream[VT]]:
+    ) -> Optional[ArrayLinearStream[VT]]:
         """Returns a new stream that filters out the values that do not
         satisfy the predicate.
 
@@ -191,31 +1795,39 @@ class SinglyLinkedStream(LinearStream[VT]):
             validity.
         """
 
-        if predicate is None:
-            def predicate(value):
-                return bool(value)
+        return self._from_iterator(filter(predicate, iter(self)))
 
-        node = self
+    @classmethod
+    def from_iterable(
+            cls,
+            iterable: Iterable[VT],
+            does_memoize: bool=True,
+    ) -> Optional[ArrayLinearStream[VT]]:
+        """Returns a new stream that contains the data from an iterable.
+        The values are copied immediately, so the iterable must be
+        finite. Lists and tuples are copied in bulk rather than
+        element by element.
 
-        while not predicate(node.value):
-            if (node := node.next) is None:
-                return node
+        :param iterable: the iterable from which to create the stream
 
-        return self.__class__(
-            node._value,
-            lambda: node.next.filter(predicate),
-            does_memoize=node.does_memoize,
-        )
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of array linear streams are always
+            stored.
+        """
+
+        return cls(data) if (data := list(iterable)) else None
 
     @classmethod
     def map(
             cls,
             fn: Callable[..., MT],
-            *streams: SinglyLinkedStream,
+            *streams: Stream,
             does_memoize: bool=True
-    ) -> SinglyLinkedStream[MT]:
+    ) -> Optional[ArrayLinearStream[MT]]:
         """Returns a new stream that contains the return values of the
-        function applied to each item in the streams.
+        function applied to each item in the streams. The result is as
+        long as the shortest of the streams, so at least one of them
+        must be finite.
 
         :param fn: the function to be applied to each value in the
             stream
@@ -223,159 +1835,312 @@ class SinglyLinkedStream(LinearStream[VT]):
         :param streams: the tuple of streams that contain the values to
             be mapped
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of array linear streams are always
+            stored.
         """
 
-        return cls(
-            fn(*map(attrgetter('value'), streams)),
-            lambda: cls.map(
-                fn,
-                *map(attrgetter('next'), streams),
-                does_memoize=does_memoize,
-            ),
-            does_memoize=does_memoize,
-        )
+        return cls._from_iterator(map(fn, *streams))
 
-    def _starter(self, n: int) -> SinglyLinkedStream[VT]:
+    @classmethod
+    def _from_iterator(
+            cls,
+            iterator: Iterator[VT],
+            does_memoize: bool=True,
+    ) -> Optional[ArrayLinearStream[VT]]:
+        """Returns a new stream that contains data from an iterator. The
+        iterator is exhausted immediately, so it must be finite.
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of array linear streams are always
+            stored.
+        """
+
+        return cls(data) if (data := list(iterator)) else None
+
+    def _slicer(
+            self,
+            n: int,
+            step: int,
+    ) -> Optional[ArrayLinearStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes and that
+        skips every ``step - 1`` nodes.
+
+        :param n: the number of nodes to which to limit the stream
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        if step == 1:
+            return self._stopper(n)
+
+        index = self._index
+
+        if data := self._data[index:index + n:step]:
+            return self.__class__(data)
+
+        return None
+
+    def _starter(self, n: int) -> ArrayLinearStream[VT]:
         """Returns the node that is ``n`` nodes away from ``self``.
 
         :param n: the number of nodes away to start from ``self``
         """
 
-        node = self
+        if n == 0:
+            return self
 
-        for _ in range(n):
-            if (node := node.next) is None:
-                raise IndexError('node index out of range.')
+        if not 0 <= (index := self._index + n) < len(self._data):
+            raise IndexError('node index out of range.')
 
-        return node
+        return self.__class__(self._data, index)
 
-    def _stepper(self, n: int) -> SinglyLinkedStream[VT]:
+    def _stepper(self, n: int) -> ArrayLinearStream[VT]:
         """Returns a new stream that skips every ``n - 1`` nodes.
 
         :param n: the number of nodes to skip between nodes
         """
 
-        def step(
-                node: SinglyLinkedStream[VT],
-                i: int,
-        ) -> Optional[SinglyLinkedStream[VT]]:
-            try:
-                node = node._starter(i)
-            except IndexError:
-                return None
+        if n < 1:
+            raise ValueError(f'step must be positive integer, not {n}')
 
-            return node._stepper(i)
+        if n == 1:
+            return self
 
-        return self.__class__(
-            self._value,
-            lambda: step(self, n),
-            does_memoize=self.does_memoize,
-        )
+        return self.__class__(self._data[self._index::n])
 
-    def _stopper(self, n: int) -> Optional[SinglyLinkedStream[VT]]:
+    def _stopper(self, n: int) -> Optional[ArrayLinearStream[VT]]:
         """Returns a new stream that is limited to ``n`` nodes.
 
         :param n: the number of nodes to which to limit the stream
         """
 
-        def stop(
-                node: SinglyLinkedStream[VT],
-                i: int,
-        ) -> Optional[SinglyLinkedStream[VT]]:
-            if (next_ := node.next) is None:
-                if i > 1:
-                    raise IndexError('node index out of range.')
+        if n == 0:
+            return None
 
-                return None
+        if (stop := self._index + n) > len(self._data):
+            raise IndexError('node index out of range.')
 
-            return next_._stopper(i - 1)
+        return self.__class__(self._data[self._index:stop])
 
-        return None if n == 0 else self.__class__(
-            self._value,
-            lambda: stop(self, n),
-            does_memoize=self.does_memoize,
+
+class PackedLinearStream(ArrayLinearStream[VT]):
+    """An array linear stream whose values are packed into an
+    ``array.array`` rather than a list. This suits long streams of
+    numbers of a single type. Each value occupies only the size of its
+    machine type (e.g. 8 bytes for a ``'d'`` float) instead of a
+    pointer to a separate Python object, so traversals touch much less
+    memory. Values are converted to Python objects as they are read.
+    Filtered and sliced streams keep the type code of the stream from
+    which they are derived, and mapped streams default to the type code
+    of their first packed or chunked input.
+    """
+
+    __slots__: Iterable[str] = ()
+
+    _data: array
+
+    @classmethod
+    def from_iterable(
+            cls,
+            iterable: Iterable[VT],
+            does_memoize: bool=True,
+            typecode: Optional[str]=None,
+    ) -> Optional[PackedLinearStream[VT]]:
+        """Returns a new stream that contains the data from an iterable.
+        The values are copied immediately, so the iterable must be
+        finite. Arrays, lists, and tuples are copied in bulk rather
+        than element by element.
+
+        :param iterable: the iterable from which to create the stream
+
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of packed linear streams are always
+            stored.
+
+        :param typecode: the ``array.array`` type code of the values. It
+            defaults to the type code of ``iterable`` if it is an array
+            or a packed or chunked linear stream and to ``'d'``
+            otherwise.
+        """
+
+        if typecode is None:
+            typecode = _typecode_of(iterable)
+
+        if isinstance(iterable, (array, list, tuple)):
+            return cls(data) if (data := array(typecode, iterable)) else None
+
+        return cls._from_iterator(iter(iterable), does_memoize, typecode)
+
+    def reduce(
+            self,
+            fn: Callable[[Any, VT], Any],
+            initial: Any=_NO_INITIAL,
+    ) -> Any:
+        """Returns the result of cumulatively applying the function to
+        the values in the stream from left to right, as
+        ``functools.reduce`` does. Reductions by ``max`` and ``min`` are
+        delegated to the built-in functions, as are reductions of
+        integers by ``operator.add`` and ``operator.mul`` from an
+        omitted or integer ``initial``. Sums and products of floats are
+        always accumulated from left to right because ``sum`` might
+        round them differently.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param initial: the result with which to start. If it is
+            omitted, then the first value of the stream is used.
+        """
+
+        iterator = iter(self)
+
+        if initial is not _NO_INITIAL:
+            iterator = chain((initial,), iterator)
+
+        if fn is max or fn is min:
+            return fn(iterator)
+
+        if (
+                self._data.typecode in _INTEGER_TYPECODES
+                and (initial is _NO_INITIAL or type(initial) is int)
+        ):
+            if fn is add:
+                return sum(iterator, next(iterator))
+
+            if fn is mul:
+                return prod(iterator, start=next(iterator))
+
+        return super().reduce(fn, initial)
+
+    @property
+    def typecode(self) -> str:
+        """Returns the ``array.array`` type code of the values."""
+
+        return self._data.typecode
+
+    def filter(
+            self,
+            predicate: Callable[[VT], bool]=None,
+    ) -> Optional[PackedLinearStream[VT]]:
+        """Returns a new stream that filters out the values that do not
+        satisfy the predicate.
+
+        :param predicate: the function to apply to the values in the
+            stream. It defaults to testing each value itself for
+            validity.
+        """
+
+        return self._from_iterator(
+            filter(predicate, iter(self)),
+            typecode=self._data.typecode,
         )
 
     @classmethod
-    def _from_iterator(
+    def map(
             cls,
-            iterator: Iterator[VT],
+            fn: Callable[..., MT],
+            *streams: Stream,
             does_memoize: bool=True,
-    ) -> Optional[SinglyLinkedStream[VT]]:
-        """Returns a new stream that contains data from an iterator. Use
-        of the iterator elsewhere afterward is generally inadvisable.
-        Otherwise, the stream might become out of sync.
+            typecode: Optional[str]=None,
+    ) -> Optional[PackedLinearStream[MT]]:
+        """Returns a new stream that contains the return values of the
+        function applied to each item in the streams. The result is as
+        long as the shortest of the streams, so at least one of them
+        must be finite.
 
-        :param iterator: the iterator that will be used to retrieve the
-            values for the stream
+        :param fn: the function to be applied to each value in the
+            stream
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
+        :param streams: the tuple of streams that contain the values to
+            be mapped
+
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of packed linear streams are always
+            stored.
+
+        :param typecode: the ``array.array`` type code of the return
+            values of ``fn``. It defaults to the type code of the first
+            of ``streams`` that is a packed or chunked linear stream and
+            to ``'d'`` if there is none. Pass it explicitly if ``fn``
+            returns values of a different type.
         """
 
-        try:
-            return cls(
-                next(iterator),
-                lambda: cls._from_iterator(iterator),
-                does_memoize=does_memoize,
+        if typecode is None:
+            typecode = next(
+                (
+                    stream.typecode
+                    for stream in streams
+                    if isinstance(
+                        stream,
+                        (PackedLinearStream, ChunkedLinearStream),
+                    )
+                ),
+                'd',
             )
-        except StopIteration:
-            return None
 
+        return cls._from_iterator(map(fn, *streams), typecode=typecode)
+
+    @classmethod
+    def _from_iterator(
+            cls,
+            iterator: Iterator[VT],
+            does_memoize: bool=True,
+            typecode: str='d',
+    ) -> Optional[PackedLinearStream[VT]]:
+        """Returns a new stream that contains data from an iterator. The
+        iterator is exhausted immediately, so it must be finite.
+
+        :param iterator: the iterator that will be used to retrieve the
+            values for the stream
+
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of packed linear streams are always
+            stored.
 
-class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
-    """A doubly linked list class implemented as a stream."""
+        :param typecode: the ``array.array`` type code of the values
+        """
+
+        return cls(data) if (data := array(typecode, iterator)) else None
+
+
+class ChunkedLinearStream(LinearStream[VT]):
+    """A linear stream whose values are packed into a linked list of
+    ``array.array`` chunks. Like ``PackedLinearStream``, this suits long
+    streams of numbers of a single type, but the chunks are read from
+    the underlying iterator as they are needed, so chunked linear
+    streams can be lazy and infinite. The first chunk holds one value
+    and each following chunk holds twice as many as the one before it,
+    up to 64. Reading a value can therefore compute up to 63 values
+    ahead of it, which blocks if those values are never produced (e.g.
+    when a filter over an infinite stream has no further matches).
+    Each node is a lightweight view of one position in a chunk, and
+    every value is stored, so the values are always memoized. Use
+    ``from_iterable`` to create a stream.
+    """
 
     __slots__: Iterable[str] = (
-        '_previous',
-        '_previous_thunk',
+        '_chunk',
+        '_index',
     )
 
-    _previous: Optional[DoublyLinkedStream[VT]]
-    _previous_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]]
-
-    def __init__(
-            self,
-            value: VT,
-            next_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]],
-            previous_thunk: Callable[[], Optional[DoublyLinkedStream[VT]]]=None,
-            *,
-            does_memoize: bool=True
-    ) -> None:
-        """:param value: the value of the stream node
-
-        :param next_thunk: a zero-argument function that should return
-            the following node
+    _chunk: _Chunk
+    _index: int
 
-        :param previous_thunk is a zero-argument function that should
-            return the preceding node. It defaults to behaving similarly
-            to singly linked nodes.
+    def __init__(self, chunk: _Chunk, index: int=0) -> None:
+        """:param chunk: the chunk that contains the value of the node
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
+        :param index: the position in ``chunk`` of the value of the node
 
         Changing any of these values after initialization might cause
         unexpected results.
         """
 
-        super().__init__(value, next_thunk, does_memoize=does_memoize)
-
-        if previous_thunk is None:
-            def previous_thunk():
-                return None
-
-        self._previous_thunk = previous_thunk
+        self._chunk = chunk
+        self._index = index
 
     def __contains__(self, value: VT) -> bool:
         """Determines whether ``value`` is in the stream. Use with
@@ -384,88 +2149,86 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
         :param value: the value for which to search
         """
 
-        return value in iter(self) or value in iter(reversed(self).next)
+        return value in iter(self)
+
+    def __iter__(self) -> Iterator[VT]:
+        """Returns an iterator that yields the values from the stream.
+        """
+
+        chunk = self._chunk
+
+        if self._index == 0:
+            yield from chunk.data
+        else:
+            yield from islice(chunk.data, self._index, None)
+
+        while (chunk := chunk.next) is not None:
+            yield from chunk.data
 
     def __repr__(self) -> str:
-        """Returns the canonical string representation of the node."""
+        """Returns the canonical string representation of the stream
+        node. To keep it short, long chunks are abbreviated.
+        """
 
-        return '{}({}, {}, {}, does_memoize={})'.format(
+        return '{}({}, {})'.format(
             self.__class__.__name__,
-            repr(self._value),
-            repr(self._next_thunk),
-            repr(self._previous_thunk),
-            repr(self.does_memoize)
+            bounded_repr(self._chunk.data),
+            repr(self._index),
         )
 
-    def __reversed__(self) -> DoublyLinkedStream[VT]:
-        """Returns the stream in reverse."""
-
-        if self.does_memoize:
-            def next_init(obj):
-                try:
-                    obj._previous = node
-                except AttributeError:
-                    pass
-
-            def previous_init(obj):
-                try:
-                    obj._next = node
-                except AttributeError:
-                    pass
-
-            return (node := self.__class__(
-                self.value,
-                thunk_init(
-                    lambda: reversed_node(self.previous),
-                    next_init,
-                ),
-                thunk_init(
-                    lambda: reversed_node(self.next),
-                    previous_init,
-                ),
-                does_memoize=True,
-            ))
+    @classmethod
+    def from_iterable(
+            cls,
+            iterable: Iterable[VT],
+            does_memoize: bool=True,
+            typecode: Optional[str]=None,
+    ) -> Optional[ChunkedLinearStream[VT]]:
+        """Returns a new stream that contains data from an iterable.
+        Use of the iterable elsewhere afterward is generally inadvisable
+        Otherwise, the stream might become out of sync.
 
-        return self.__class__(
-            self.value,
-            lambda: reversed_node(self.previous),
-            lambda: reversed_node(self.next),
-            does_memoize=False,
-        )
+        :param iterable: the iterable from which to create the stream
 
-    @property
-    def next(self) -> Optional[DoublyLinkedStream[VT]]:
-        """Returns the next node."""
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of chunked linear streams are always
+            stored.
 
-        try:
-            return self._next
-        except AttributeError:
-            next_ = self._next_thunk()
+        :param typecode: the ``array.array`` type code of the values. It
+            defaults to the type code of ``iterable`` if it is an array
+            or a packed or chunked linear stream and to ``'d'``
+            otherwise.
+        """
 
-            if self.does_memoize:
-                self._next = next_
+        if typecode is None:
+            typecode = _typecode_of(iterable)
 
-            return next_
+        return cls._from_iterator(iter(iterable), does_memoize, typecode)
 
     @property
-    def previous(self) -> Optional[DoublyLinkedStream[VT]]:
-        """Returns the previous node."""
+    def next(self) -> Optional[ChunkedLinearStream[VT]]:
+        """Returns the next node. Since nodes are views, a new node is
+        returned every time.
+        """
 
-        try:
-            return self._previous
-        except AttributeError:
-            previous = self._previous_thunk()
+        if (index := self._index + 1) < len(self._chunk.data):
+            return self.__class__(self._chunk, index)
 
-            if self.does_memoize:
-                self._previous = previous
+        if (chunk := self._chunk.next) is None:
+            return None
+
+        return self.__class__(chunk)
+
+    @property
+    def typecode(self) -> str:
+        """Returns the ``array.array`` type code of the values."""
 
-            return previous
+        return self._chunk.data.typecode
 
     @property
     def value(self) -> VT:
         """Returns the value of the node."""
 
-        return self._value
+        return self._chunk.data[self._index]
 
     @value.setter
     def value(self, value: VT) -> None:
@@ -474,12 +2237,12 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
         :param value: the value to set
         """
 
-        self._value = value
+        self._chunk.data[self._index] = value
 
     def filter(
             self,
             predicate: Callable[[VT], bool]=None,
-    ) -> Optional[DoublyLinkedStream[VT]]:
+    ) -> Optional[ChunkedLinearStream[VT]]:
         """Returns a new stream that filters out the values that do not
         satisfy the predicate.
 
@@ -488,19 +2251,19 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
             validity.
         """
 
-        if predicate is None:
-            def predicate(value):
-                return value
-
-        return self._filter(predicate, TraversalDirection.NEXT)
+        return self._from_iterator(
+            filter(predicate, iter(self)),
+            typecode=self.typecode,
+        )
 
     @classmethod
     def map(
             cls,
             fn: Callable[..., MT],
-            *streams: DoublyLinkedStream,
-            does_memoize: bool=True
-    ) -> DoublyLinkedStream[MT]:
+            *streams: Stream,
+            does_memoize: bool=True,
+            typecode: Optional[str]=None,
+    ) -> Optional[ChunkedLinearStream[MT]]:
         """Returns a new stream that contains the return values of the
         function applied to each item in the streams.
 
@@ -510,133 +2273,39 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
         :param streams: the tuple of streams that contain the values to
             be mapped
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
-        """
-
-        if does_memoize:
-            def next_init(obj):
-                obj._previous = node
-
-            def previous_init(obj):
-                obj._next = node
-
-            return (node := cls(
-                fn(*map(attrgetter('value'), streams)),
-                thunk_init(
-                    lambda: cls.map(
-                        fn,
-                        *map(attrgetter('next'), streams),
-                        does_memoize=True,
-                    ),
-                    next_init,
-                ),
-                thunk_init(
-                    lambda: cls.map(
-                        fn,
-                        *map(attrgetter('previous'), streams),
-                        does_memoize=True,
-                    ),
-                    previous_init,
-                ),
-                does_memoize=True,
-            ))
-
-        return cls(
-            fn(*map(attrgetter('value'), streams)),
-            lambda: cls.map(
-                fn,
-                *map(attrgetter('next'), streams),
-                does_memoize=False,
-            ),
-            lambda: cls.map(
-                fn,
-                *map(attrgetter('previous'), streams),
-                does_memoize=False,
-            ),
-            does_memoize=False,
-        )
-
-    def _filter(
-            self,
-            predicate: Callable[[VT], bool],
-            traversal_direction: TraversalDirection,
-    ) -> Optional[DoublyLinkedStream[VT]]:
-        """Returns a new stream that filters out the values that do not
-        satisfy the predicate.
-
-        :param predicate: the function to apply to the values in the
-            stream. It defaults to testing each value itself for
-            validity.
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of chunked linear streams are always
+            stored.
 
-        :param traversal_direction: the direction in which the nodes
-            should be traversed
+        :param typecode: the ``array.array`` type code of the return
+            values of ``fn``. It defaults to the type code of the first
+            of ``streams`` that is a packed or chunked linear stream and
+            to ``'d'`` if there is none. Pass it explicitly if ``fn``
+            returns values of a different type.
         """
 
-        node = self
-
-        attribute = 'next'
-        if traversal_direction == TraversalDirection.PREVIOUS:
-            attribute = 'previous'
-
-        while not predicate(node.value):
-            node = getattr(node, attribute)
-
-            if node is None:
-                return None
-
-        if node.does_memoize:
-            def next_init(obj):
-                obj._previous = new_node
-
-            def previous_init(obj):
-                obj._next = new_node
-
-            return (new_node := node.__class__(
-                node.value,
-                thunk_init(
-                    lambda: node.next._filter(
-                        predicate,
-                        TraversalDirection.NEXT,
-                    ),
-                    next_init,
-                ),
-                thunk_init(
-                    lambda: node.previous._filter(
-                        predicate,
-                        TraversalDirection.PREVIOUS,
-                    ),
-                    previous_init,
+        if typecode is None:
+            typecode = next(
+                (
+                    stream.typecode
+                    for stream in streams
+                    if isinstance(
+                        stream,
+                        (PackedLinearStream, ChunkedLinearStream),
+                    )
                 ),
-                does_memoize=True,
-            ))
+                'd',
+            )
 
-        return self.__class__(
-            node.value,
-            lambda: node.next._filter(
-                predicate,
-                TraversalDirection.NEXT,
-            ),
-            lambda: node.previous._filter(
-                predicate,
-                TraversalDirection.PREVIOUS,
-            ),
-            does_memoize=False,
-        )
+        return cls._from_iterator(map(fn, *streams), typecode=typecode)
 
     @classmethod
     def _from_iterator(
             cls,
             iterator: Iterator[VT],
-            previous_thunk: Callable[
-                [],
-                DoublyLinkedStream[VT],
-            ]=lambda: None,
-            does_memoize: bool=True
-    ) -> Optional[DoublyLinkedStream[VT]]:
+            does_memoize: bool=True,
+            typecode: str='d',
+    ) -> Optional[ChunkedLinearStream[VT]]:
         """Returns a new stream that contains data from an iterator. Use
         of the iterator elsewhere afterward is generally inadvisable.
         Otherwise, the stream might become out of sync.
@@ -644,114 +2313,81 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
         :param iterator: the iterator that will be used to retrieve the
             values for the stream
 
-        :param previous_thunk: a zero-argument function that should
-            return the preceding node. It defaults to behaving similarly
-            to singly linked nodes.
+        :param does_memoize: This exists for compatibility with other
+            streams. The values of chunked linear streams are always
+            stored.
 
-        :param does_memoize: By default, the node will cache the result
-            of ``next_thunk``. This can potentially hog a lot of memory.
-            To turn caching off, set ``does_memoize`` to ``False``. It
-            might be desirable to propagate this to composite streams
-            generated by custom functions.
+        :param typecode: the ``array.array`` type code of the values
         """
 
-        if previous_thunk is None:
-            def previous_thunk():
-                return None
-
-        try:
-            value = next(iterator)
-        except StopIteration:
+        if (chunk := _Chunk.from_iterator(iterator, typecode)) is None:
             return None
 
-        return (node := cls(
-            value,
-            lambda: cls._from_iterator(
-                iterator,
-                lambda: node,
-                does_memoize=does_memoize,
-            ),
-            previous_thunk,
-            does_memoize=does_memoize,
-        ))
+        return cls(chunk)
 
-    def _starter(self, n: int) -> DoublyLinkedStream[VT]:
-        """Returns the node that is ``n`` nodes away from ``self``.
+    def _slicer(
+            self,
+            n: int,
+            step: int,
+    ) -> Optional[ChunkedLinearStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes and that
+        skips every ``step - 1`` nodes.
+
+        :param n: the number of nodes to which to limit the stream
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        if step == 1:
+            return self._stopper(n)
+
+        return self._from_iterator(
+            islice(iter(self), 0, n, step),
+            typecode=self.typecode,
+        )
+
+    def _starter(self, n: int) -> ChunkedLinearStream[VT]:
+        """Returns the node that is ``n`` nodes away from ``self``. Since
+        the chunks are singly linked, ``n`` must be nonnegative.
 
         :param n: the number of nodes away to start from ``self``
         """
 
-        node = self
-        attribute = 'next'
+        if n == 0:
+            return self
 
         if n < 0:
-            n = abs(n)
-            attribute = 'previous'
+            raise IndexError('node index out of range.')
 
-        for _ in range(abs(n)):
-            node = getattr(node, attribute)
+        chunk = self._chunk
+        index = self._index + n
 
-            if node is None:
+        while index >= (length := len(chunk.data)):
+            if (chunk := chunk.next) is None:
                 raise IndexError('node index out of range.')
 
-        return node
+            index -= length
 
-    def _stepper(self, n: int) -> DoublyLinkedStream[VT]:
+        return self.__class__(chunk, index)
+
+    def _stepper(self, n: int) -> ChunkedLinearStream[VT]:
         """Returns a new stream that skips every ``n - 1`` nodes.
 
         :param n: the number of nodes to skip between nodes
         """
 
-        def step_forward(cursor, offset):
-            try:
-                cursor = cursor._starter(offset)
-            except IndexError:
-                return None
-
-            return cursor._stepper(n)
-
-        def step_backward(cursor, offset):
-            try:
-                cursor = cursor._starter(-offset)
-            except IndexError:
-                return None
-
-            return cursor._stepper(n)
+        if n < 1:
+            raise ValueError(f'step must be positive integer, not {n}')
 
-        if self.does_memoize:
-            def next_init(obj):
-                try:
-                    obj._previous = node
-                except AttributeError:
-                    pass
-
-            def previous_init(obj):
-                try:
-                    obj._next = node
-                except AttributeError:
-                    pass
-
-            return (node := self.__class__(
-                self._value,
-                thunk_init(
-                    lambda: step_forward(self, n),
-                    next_init,
-                ),
-                thunk_init(
-                    lambda: step_backward(self, n),
-                    previous_init,
-                ),
-                does_memoize=self.does_memoize,
-            ))
+        if n == 1:
+            return self
 
-        return self.__class__(
-            self._value,
-            lambda: step_forward(self, n),
-            lambda: step_backward(self, n),
-            does_memoize=self.does_memoize,
+        return self._from_iterator(
+            islice(iter(self), 0, None, n),
+            typecode=self.typecode,
         )
 
-    def _stopper(self, n: int) -> Optional[DoublyLinkedStream[VT]]:
+    def _stopper(self, n: int) -> Optional[ChunkedLinearStream[VT]]:
         """Returns a new stream that is limited to ``n`` nodes.
 
         :param n: the number of nodes to which to limit the stream
@@ -760,40 +2396,81 @@ class DoublyLinkedStream(SinglyLinkedStream[VT], Reversible[VT]):
         if n == 0:
             return None
 
-        if self.does_memoize:
-            def next_init(obj):
-                try:
-                    obj._previous = node
-                except AttributeError:
-                    pass
-
-            def previous_init(obj):
-                try:
-                    obj._next = node
-                except AttributeError:
-                    pass
-
-            return (node := self.__class__(
-                self._value,
-                thunk_init(
-                    lambda: self.next._stopper(n - 1),
-                    next_init,
-                ),
-                thunk_init(
-                    lambda: self.previous._stopper(n + 1),
-                    previous_init,
-                ),
-                does_memoize=True,
-            ))
-
-        return self.__class__(
-            self._value,
-            lambda: self.next._stopper(n - 1),
-            lambda: self.previous._stopper(n + 1),
-            does_memoize=False,
+        return self._from_iterator(
+            _LimitedIterator(iter(self), n),
+            typecode=self.typecode,
         )
 
 
+class Checkpoints:
+    """Remembers the nodes of a stream at power-of-two distances from
+    its head so that repeated long walks from the head resume partway
+    rather than starting over. For example, ``checkpoints =
+    Checkpoints(stream)`` followed by ``checkpoints[100000]`` walks at
+    most half of the distance again on later lookups of the same or
+    nearby indices. Indexing a stream directly never records anything.
+    The checkpoints belong to this object, so they are released with
+    it.
+
+    Since the checkpoints are nodes of the stream, only walks of at
+    least 64 nodes from a memoizing stream are recorded. Other lookups
+    walk the stream as indexing it would.
+    """
+
+    __slots__: Iterable[str] = (
+        'stream',
+        '_nodes',
+    )
+
+    stream: SinglyLinkedStream
+    _nodes: dict[int, SinglyLinkedStream]
+
+    def __init__(self, stream: SinglyLinkedStream) -> None:
+        """:param stream: the node from which to walk"""
+
+        self.stream = stream
+        self._nodes = {}
+
+    def __getitem__(self, n: int) -> Any:
+        """Returns the value of the node that is ``n`` nodes away from
+        the stream.
+
+        :param n: the number of nodes away from the stream
+        """
+
+        return self.node(n).value
+
+    def node(self, n: int) -> SinglyLinkedStream:
+        """Returns the node that is ``n`` nodes away from the stream.
+
+        :param n: the number of nodes away from the stream
+        """
+
+        stream = self.stream
+
+        if n < _MIN_CHECKPOINT_DISTANCE or not stream.does_memoize:
+            return stream._starter(n)
+
+        nodes = self._nodes
+        distance = 1 << (n.bit_length() - 1)
+
+        while distance and distance not in nodes:
+            distance >>= 1
+
+        node = nodes[distance] if distance else stream
+        checkpoint = distance << 1 or 1
+
+        while distance < n:
+            target = min(checkpoint, n)
+            node = node._starter(target - distance)
+
+            if (distance := target) == checkpoint:
+                nodes[checkpoint] = node
+                checkpoint <<= 1
+
+        return node
+
+
 def thunk_init(
         thunk: Callable[[], VT],
         init: Callable[[Any], None],
@@ -21,7 +21,12 @@ from collections.abc import (
     Iterable,
     Iterator,
 )
+from functools import reduce
+from itertools import islice
+from operator import index
+from reprlib import repr as bounded_repr
 from typing import (
+    Any,
     Optional,
     TypeVar,
     Union,
@@ -35,6 +40,8 @@ __all__ = (
 MT = TypeVar('MT')  # type of values after mapping
 VT = TypeVar('VT')  # type of values before or without mapping
 
+_NO_INITIAL = object()  # marks an omitted initial value of ``reduce``
+
 
 class Stream(Container[VT], metaclass=ABCMeta):
     """An abstract base class for stream classes (i.e. an
@@ -46,9 +53,11 @@ class Stream(Container[VT], metaclass=ABCMeta):
     __slots__: Iterable[str] = ()
 
     def __repr__(self) -> str:
-        """Returns the canonical string representation of the node."""
+        """Returns the canonical string representation of the node. To
+        keep it short, large values are abbreviated.
+        """
 
-        return f'{self.__class__.__name__}({repr(self.value)})'
+        return f'{self.__class__.__name__}({bounded_repr(self.value)})'
 
     @property
     @abstractmethod
@@ -110,46 +119,16 @@ class LinearStream(Stream[VT], Iterable[VT], metaclass=ABCMeta):
             to ``self``.
         """
 
-        if isinstance(key, int):
+        if type(key) is int or isinstance(key, int):
             return self._starter(key).value
 
-        start, stop, step = key.start, key.stop, key.step
-
-        node = self
-
-        if start is not None:
-            if start < 0:
-                raise ValueError(
-                    f'start must be nonnegative integer, not {start}'
-                )
+        if isinstance(key, slice):
+            return self._getitem_slice(key)
 
-            node = node._starter(start)
-
-        if stop is not None:
-            if stop < 0:
-                raise ValueError(
-                    f'stop must be nonnegative integer, not {stop}'
-                )
-
-            if start is not None:
-                stop -= start
-
-                if start > stop:
-                    raise ValueError(
-                        'start must be less than or equal to stop'
-                    )
-
-            node = node._stopper(stop)
-
-        if step is not None:
-            if step <= 0:
-                raise ValueError(
-                    f'step must be positive integer, not {step}'
-                )
-
-            node = node._stepper(step)
-
-        return node
+        raise TypeError(
+            f'stream indices must be integers or slices, not '
+            f'{type(key).__name__}'
+        )
 
     def __iter__(self) -> Iterator[VT]:
         """Returns an iterator that yields the values from the stream.
@@ -204,6 +183,38 @@ class LinearStream(Stream[VT], Iterable[VT], metaclass=ABCMeta):
 
         return cls._from_iterator(iter(iterable), does_memoize)
 
+    def reduce(
+            self,
+            fn: Callable[[Any, VT], Any],
+            initial: Any=_NO_INITIAL,
+    ) -> Any:
+        """Returns the result of cumulatively applying the function to
+        the values in the stream from left to right, as
+        ``functools.reduce`` does. The stream must be finite.
+
+        :param fn: the two-argument function to be applied to the
+            preceding result and the next value in the stream
+
+        :param initial: the result with which to start. If it is
+            omitted, then the first value of the stream is used.
+        """
+
+        if initial is _NO_INITIAL:
+            return reduce(fn, self)
+
+        return reduce(fn, self, initial)
+
+    def take(self, n: int) -> list[VT]:
+        """Returns a list of the first ``n`` values in the stream. If the
+        stream has fewer than ``n`` nodes, then the list contains all of
+        its values. Unlike slicing, this does not create any
+        intermediate stream nodes.
+
+        :param n: the number of values to take from the stream
+        """
+
+        return list(islice(self, n))
+
     @classmethod
     @abstractmethod
     def _from_iterator(
@@ -215,6 +226,11 @@ class LinearStream(Stream[VT], Iterable[VT], metaclass=ABCMeta):
         of the iterator elsewhere afterward is generally inadvisable.
         Otherwise, the stream might become out of sync.
 
+        Implementations should take values from the iterator one node
+        at a time as the stream is traversed, or all at once in a loop,
+        but never by recursing once per value. Recursion exhausts the
+        call stack on long iterators.
+
         :param iterator: the iterator that will be used to retrieve the
             values for the stream
 
@@ -227,6 +243,82 @@ class LinearStream(Stream[VT], Iterable[VT], metaclass=ABCMeta):
 
         raise NotImplementedError
 
+    def _getitem_slice(self, key: slice) -> Optional[LinearStream[VT]]:
+        """Returns the items contained within a particular slice.
+
+        :param key: a slice object whose ``start`` and ``stop`` values
+            are integers
+        """
+
+        start, length, step = self._normalize_slice(key)
+        node = self._starter(start)
+
+        if length is None:
+            return node._stepper(step)
+
+        return node._slicer(length, step)
+
+    @staticmethod
+    def _normalize_slice(key: slice) -> tuple[int, Optional[int], int]:
+        """Returns the start, the length, and the step of a slice with
+        the defaults of omitted values filled in. The length is
+        ``None`` if the slice has no ``stop`` value.
+
+        :param key: a slice object whose ``start``, ``stop``, and
+            ``step`` values are integers, objects that define
+            ``__index__``, or ``None``
+        """
+
+        start, stop, step = key.start, key.stop, key.step
+
+        if start is None:
+            start = 0
+        elif type(start) is not int:
+            start = index(start)
+
+        if stop is not None and type(stop) is not int:
+            stop = index(stop)
+
+        if step is None:
+            step = 1
+        elif type(step) is not int:
+            step = index(step)
+
+        if start < 0 or step <= 0 or (stop is not None and stop < start):
+            if start < 0:
+                raise ValueError(
+                    f'start must be nonnegative integer, not {start}'
+                )
+
+            if step <= 0:
+                raise ValueError(
+                    f'step must be positive integer, not {step}'
+                )
+
+            if stop < 0:
+                raise ValueError(
+                    f'stop must be nonnegative integer, not {stop}'
+                )
+
+            raise ValueError('start must be less than or equal to stop')
+
+        return start, None if stop is None else stop - start, step
+
+    def _slicer(self, n: int, step: int) -> Optional[LinearStream[VT]]:
+        """Returns a new stream that is limited to ``n`` nodes and that
+        skips every ``step - 1`` nodes. Subclasses may override this to
+        do both in a single pass.
+
+        :param n: the number of nodes to which to limit the stream
+
+        :param step: the number of nodes to skip between nodes
+        """
+
+        if (node := self._stopper(n)) is None:
+            return None
+
+        return node._stepper(step)
+
     @abstractmethod
     def _starter(self, n: int) -> LinearStream[VT]:
         """Returns the node that is ``n`` nodes away from ``self``.
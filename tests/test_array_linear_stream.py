@@ -0,0 +1,101 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from itertools import count
+from unittest import TestCase
+
+from streams import ArrayLinearStream, SinglyLinkedStream
+
+
+class ArrayLinearStreamTestCase(TestCase):
+    def test_empty_iterable(self):
+        self.assertIsNone(ArrayLinearStream.from_iterable([]))
+        self.assertIsNone(ArrayLinearStream.from_iterable(iter(())))
+
+    def test_indexing_at_the_bounds(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+        node = stream._starter(3)
+
+        self.assertEqual(stream[0], 0)
+        self.assertEqual(stream[4], 4)
+        self.assertEqual(node._starter(-2).value, 1)
+        self.assertEqual(node._starter(-3).value, 0)
+
+        with self.assertRaises(IndexError):
+            stream[5]
+
+        with self.assertRaises(IndexError):
+            node._starter(-4)
+
+    def test_slicing_at_the_bounds(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+
+        self.assertIsInstance(stream[1:4], ArrayLinearStream)
+        self.assertEqual(list(stream[1:4]), [1, 2, 3])
+        self.assertEqual(list(stream[3:]), [3, 4])
+        self.assertEqual(list(stream[4:5]), [4])
+        self.assertEqual(list(stream[0:5:2]), [0, 2, 4])
+
+        with self.assertRaises(IndexError):
+            stream[5:]
+
+        with self.assertRaises(IndexError):
+            stream[:10]
+
+    def test_slices_are_copies(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+        sliced = stream[1:4]
+
+        stream._starter(2).value = 20
+
+        self.assertEqual(stream[2], 20)
+        self.assertEqual(sliced[1], 2)
+
+    def test_nodes_share_values(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+
+        stream._starter(3).value = 30
+
+        self.assertEqual(stream[3], 30)
+        self.assertEqual(stream.next[2], 30)
+
+    def test_contains(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+
+        self.assertIn(0, stream)
+        self.assertIn(4, stream)
+        self.assertNotIn(5, stream)
+        self.assertNotIn(0, stream.next)
+
+    def test_length_hint(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+
+        self.assertEqual(stream.__length_hint__(), 5)
+        self.assertEqual(stream._starter(3).__length_hint__(), 2)
+
+    def test_filter_and_map(self):
+        stream = ArrayLinearStream.from_iterable(range(5))
+        infinite = SinglyLinkedStream.from_iterable(count())
+
+        self.assertEqual(list(stream.filter(lambda x: x % 2)), [1, 3])
+        self.assertIsNone(stream.filter(lambda x: x > 9))
+        self.assertEqual(
+            list(ArrayLinearStream.map(lambda x: 2 * x, stream)),
+            [0, 2, 4, 6, 8],
+        )
+        self.assertEqual(
+            list(ArrayLinearStream.map(lambda x, y: x + y, stream, infinite)),
+            [0, 2, 4, 6, 8],
+        )
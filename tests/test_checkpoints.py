@@ -0,0 +1,137 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+import gc
+import weakref
+from itertools import count
+from threading import Thread
+from unittest import TestCase
+
+from streams import Checkpoints, DoublyLinkedStream, SinglyLinkedStream
+
+
+class Value:
+    def __init__(self, n):
+        self.n = n
+
+
+class CheckpointsTestCase(TestCase):
+    def test_walks_across_power_of_two_boundaries(self):
+        checkpoints = Checkpoints(SinglyLinkedStream.from_iterable(count()))
+
+        for n in (0, 1, 63, 64, 65, 127, 128, 129, 255, 256, 257, 1024):
+            with self.subTest(n=n):
+                self.assertEqual(checkpoints[n], n)
+
+    def test_repeated_walks_return_the_same_nodes(self):
+        checkpoints = Checkpoints(SinglyLinkedStream.from_iterable(count()))
+        first = checkpoints.node(1000)
+
+        self.assertIs(checkpoints.node(1000), first)
+        self.assertIs(checkpoints.node(999).next, first)
+        self.assertEqual(checkpoints[513], 513)
+        self.assertEqual(checkpoints[5000], 5000)
+        self.assertIs(checkpoints.node(1000), first)
+        self.assertIs(checkpoints.stream._starter(1000), first)
+
+    def test_checkpoints_stay_valid_after_a_failed_walk(self):
+        checkpoints = Checkpoints(SinglyLinkedStream.from_iterable(range(100)))
+
+        with self.assertRaises(IndexError):
+            checkpoints[100]
+
+        self.assertEqual(checkpoints[99], 99)
+        self.assertEqual(checkpoints[64], 64)
+
+    def test_changed_values_are_visible_through_checkpoints(self):
+        stream = SinglyLinkedStream.from_iterable(count())
+        checkpoints = Checkpoints(stream)
+        checkpoints[200]
+        stream._starter(128).value = 'changed'
+
+        self.assertEqual(checkpoints[128], 'changed')
+
+    def test_non_memoizing_streams_are_walked_from_the_head(self):
+        stream = SinglyLinkedStream.map(
+            lambda n: n,
+            SinglyLinkedStream.from_iterable(count()),
+            does_memoize=False,
+        )
+        checkpoints = Checkpoints(stream)
+
+        self.assertEqual(checkpoints[100], 100)
+        self.assertEqual(checkpoints._nodes, {})
+
+    def test_doubly_linked_walks(self):
+        stream = DoublyLinkedStream.from_iterable(range(1000))
+        checkpoints = Checkpoints(stream)
+        end = checkpoints.node(999)
+
+        self.assertEqual(end.value, 999)
+        self.assertIs(checkpoints.node(999), end)
+        self.assertEqual(end._starter(-500).value, 499)
+        self.assertEqual(Checkpoints(end)[-999], 0)
+
+    def test_indexing_does_not_keep_streams_alive(self):
+        values = [Value(n) for n in range(1000)]
+        reference = weakref.ref(values[0])
+        stream = SinglyLinkedStream.from_iterable(values)
+        del values
+
+        self.assertEqual(stream[500].n, 500)
+        self.assertEqual(list(stream[100:200:3])[-1].n, 199)
+
+        del stream
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_checkpoints_are_released_with_their_owner(self):
+        values = [Value(n) for n in range(1000)]
+        reference = weakref.ref(values[0])
+        checkpoints = Checkpoints(SinglyLinkedStream.from_iterable(values))
+        del values
+
+        self.assertEqual(checkpoints[500].n, 500)
+
+        del checkpoints
+        gc.collect()
+
+        self.assertIsNone(reference())
+
+    def test_separate_streams_in_threads(self):
+        errors = []
+
+        def walk(offset):
+            try:
+                checkpoints = Checkpoints(
+                    SinglyLinkedStream.from_iterable(count(offset)),
+                )
+
+                for n in range(64, 2000, 37):
+                    if checkpoints[n] != offset + n:
+                        errors.append((offset, n))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [Thread(target=walk, args=(i,)) for i in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
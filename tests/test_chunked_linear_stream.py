@@ -0,0 +1,86 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array
+from itertools import count
+from unittest import TestCase
+
+from streams import ChunkedLinearStream
+
+
+class ChunkedLinearStreamTestCase(TestCase):
+    def test_infinite_iterable(self):
+        stream = ChunkedLinearStream.from_iterable(count())
+
+        self.assertEqual(stream.typecode, 'd')
+        self.assertEqual(stream.take(3), [0.0, 1.0, 2.0])
+        self.assertEqual(stream.filter(lambda x: x < 3).value, 0.0)
+        self.assertIn(1000, stream)
+
+    def test_indexing_across_chunks(self):
+        stream = ChunkedLinearStream.from_iterable(count())
+
+        for n in (0, 1, 2, 3, 7, 63, 64, 127, 128, 1000):
+            with self.subTest(n=n):
+                self.assertEqual(stream[n], n)
+                self.assertEqual(stream[n:].value, n)
+
+        with self.assertRaises(IndexError):
+            stream._starter(-1)
+
+    def test_indexing_at_the_bounds(self):
+        stream = ChunkedLinearStream.from_iterable(range(5), typecode='q')
+
+        self.assertEqual(list(stream), [0, 1, 2, 3, 4])
+        self.assertEqual(stream[4], 4)
+        self.assertEqual(list(stream[4:5]), [4])
+
+        with self.assertRaises(IndexError):
+            stream[5]
+
+    def test_limits_are_lazy(self):
+        stream = ChunkedLinearStream.from_iterable(count())
+
+        self.assertEqual(stream[:10 ** 10].take(3), [0.0, 1.0, 2.0])
+        self.assertEqual(stream[5:20:5].take(5), [5.0, 10.0, 15.0])
+
+    def test_short_limits(self):
+        limited = ChunkedLinearStream.from_iterable(range(5))[:10]
+
+        for _ in range(2):
+            with self.assertRaises(IndexError):
+                list(limited)
+
+    def test_typecode(self):
+        big = 2 ** 60 + 1
+        stream = ChunkedLinearStream.from_iterable(range(5), typecode='q')
+        packed = ChunkedLinearStream.from_iterable(array('q', [big]))
+
+        self.assertEqual(stream.typecode, 'q')
+        self.assertEqual(stream[1:].typecode, 'q')
+        self.assertEqual(stream.filter(lambda x: x % 2).typecode, 'q')
+        self.assertEqual(
+            ChunkedLinearStream.map(lambda x: x + 1, stream).typecode,
+            'q',
+        )
+        self.assertEqual(packed.typecode, 'q')
+        self.assertEqual(packed[0], big)
+
+    def test_contains(self):
+        stream = ChunkedLinearStream.from_iterable(range(5), typecode='q')
+
+        self.assertIn(0, stream)
+        self.assertIn(4, stream)
+        self.assertNotIn(5, stream)
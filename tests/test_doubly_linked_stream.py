@@ -0,0 +1,75 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from itertools import count
+from operator import add
+from unittest import TestCase
+
+from streams import DoublyLinkedStream
+
+
+class DoublyLinkedStreamTestCase(TestCase):
+    def test_backward_links(self):
+        stream = DoublyLinkedStream.from_iterable(range(1, 6))
+        node = stream._starter(4)
+
+        self.assertIsNone(stream.previous)
+        self.assertEqual(node.value, 5)
+        self.assertEqual(node.previous.value, 4)
+        self.assertIs(node.previous.next, node)
+        self.assertIs(stream.next.previous, stream)
+
+    def test_reversed(self):
+        stream = DoublyLinkedStream.from_iterable(range(1, 6))
+
+        self.assertEqual(list(reversed(stream._starter(4))), [5, 4, 3, 2, 1])
+        self.assertEqual(list(reversed(stream)), [1])
+
+    def test_indexing_at_the_bounds(self):
+        stream = DoublyLinkedStream.from_iterable(range(1, 6))
+
+        self.assertEqual(stream[4], 5)
+        self.assertEqual(list(stream[1:4]), [2, 3, 4])
+        self.assertEqual(list(stream[0:5:2]), [1, 3, 5])
+
+        with self.assertRaises(IndexError):
+            stream[5]
+
+        with self.assertRaises(IndexError):
+            list(stream[:10])
+
+    def test_contains_looks_backward(self):
+        node = DoublyLinkedStream.from_iterable(range(1, 6))._starter(4)
+
+        self.assertIn(1, node)
+        self.assertIn(5, node)
+        self.assertNotIn(9, node)
+
+    def test_scan_links_back(self):
+        stream = DoublyLinkedStream.from_iterable(range(1, 6))
+        node = DoublyLinkedStream.scan(add, stream)._starter(3)
+
+        self.assertEqual(node.value, 10)
+        self.assertEqual(node.previous.value, 6)
+        self.assertIs(node.previous.next, node)
+        self.assertEqual(list(reversed(node)), [10, 6, 3, 1])
+
+    def test_map_links_back(self):
+        stream = DoublyLinkedStream.from_iterable(count())
+        node = DoublyLinkedStream.map(lambda x: 2 * x, stream)._starter(3)
+
+        self.assertEqual(node.value, 6)
+        self.assertEqual(node.previous.value, 4)
+        self.assertIs(node.previous.next, node)
@@ -0,0 +1,116 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from functools import reduce
+from itertools import count
+from operator import add
+from unittest import TestCase
+
+from streams import SinglyLinkedStream
+from streams.abc import LinearStream
+
+normalize = LinearStream._normalize_slice
+
+
+class Index:
+    def __init__(self, n):
+        self.n = n
+
+    def __index__(self):
+        return self.n
+
+
+class NormalizeSliceTestCase(TestCase):
+    def test_defaults(self):
+        self.assertEqual(normalize(slice(None)), (0, None, 1))
+        self.assertEqual(normalize(slice(3, None)), (3, None, 1))
+        self.assertEqual(normalize(slice(2, 7, 3)), (2, 5, 3))
+
+    def test_empty_slices(self):
+        self.assertEqual(normalize(slice(3, 3)), (3, 0, 1))
+        self.assertEqual(normalize(slice(0, 0)), (0, 0, 1))
+
+    def test_invalid_bounds(self):
+        for key in (slice(-1, None), slice(0, None, 0), slice(0, None, -1),
+                    slice(5, 2), slice(0, -1)):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    normalize(key)
+
+    def test_index_coercion(self):
+        self.assertEqual(
+            normalize(slice(Index(1), Index(5), Index(2))),
+            (1, 4, 2),
+        )
+
+    def test_non_integer_bounds(self):
+        for key in (slice(1.5, None), slice(0, 'a'), slice(0, None, 1.0)):
+            with self.subTest(key=key):
+                with self.assertRaises(TypeError):
+                    normalize(key)
+
+
+class GetItemTestCase(TestCase):
+    def test_non_integer_keys(self):
+        stream = SinglyLinkedStream.from_iterable(count())
+
+        for key in ('a', 1.0, None):
+            with self.subTest(key=key):
+                with self.assertRaises(TypeError):
+                    stream[key]
+
+    def test_integer_subclasses(self):
+        stream = SinglyLinkedStream.from_iterable(count())
+
+        self.assertEqual(stream[True], 1)
+
+
+class TakeTestCase(TestCase):
+    def test_infinite_stream(self):
+        stream = SinglyLinkedStream.from_iterable(count())
+
+        self.assertEqual(stream.take(5), [0, 1, 2, 3, 4])
+        self.assertEqual(stream.take(0), [])
+
+    def test_short_stream(self):
+        stream = SinglyLinkedStream.from_iterable(range(3))
+
+        self.assertEqual(stream.take(5), [0, 1, 2])
+
+
+class ReduceTestCase(TestCase):
+    def test_matches_functools(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        stream = SinglyLinkedStream.from_iterable(values)
+
+        for fn in (add, max, min, lambda a, b: a - b):
+            with self.subTest(fn=fn):
+                self.assertEqual(stream.reduce(fn), reduce(fn, values))
+
+    def test_single_value(self):
+        self.assertEqual(SinglyLinkedStream(7, lambda: None).reduce(add), 7)
+
+    def test_initial(self):
+        stream = SinglyLinkedStream.from_iterable(range(4))
+
+        self.assertEqual(
+            stream.reduce(lambda acc, x: acc + [x], []),
+            [0, 1, 2, 3],
+        )
+        self.assertEqual(stream.reduce(add, 10), 16)
+        self.assertEqual(
+            SinglyLinkedStream(1, lambda: None).reduce(lambda a, b: b, None),
+            1,
+        )
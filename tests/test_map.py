@@ -0,0 +1,86 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from itertools import count
+from operator import add
+from unittest import TestCase
+
+from streams import SinglyLinkedStream
+
+
+class RecordingStream(SinglyLinkedStream):
+    __slots__ = ()
+
+    calls = []
+
+    @classmethod
+    def map(cls, fn, *streams, does_memoize=True):
+        cls.calls.append(len(streams))
+
+        return super().map(fn, *streams, does_memoize=does_memoize)
+
+
+class MapTestCase(TestCase):
+    def setUp(self):
+        RecordingStream.calls = []
+
+    def test_overridden_map_creates_every_node(self):
+        stream = RecordingStream.from_iterable(count())
+
+        self.assertEqual(
+            RecordingStream.map(lambda x: x * 2, stream).take(4),
+            [0, 2, 4, 6],
+        )
+        self.assertEqual(RecordingStream.calls, [1, 1, 1, 1])
+
+    def test_overridden_map_creates_every_node_of_pairs(self):
+        stream = RecordingStream.from_iterable(count())
+
+        self.assertEqual(
+            RecordingStream.map(add, stream, stream).take(3),
+            [0, 2, 4],
+        )
+        self.assertEqual(RecordingStream.calls, [2, 2, 2])
+
+    def test_inherited_map_keeps_the_class(self):
+        class PlainStream(SinglyLinkedStream):
+            __slots__ = ()
+
+        ints = PlainStream.from_iterable(count())
+        stream = PlainStream.map(add, ints, ints)
+
+        self.assertIsInstance(stream.next.next, PlainStream)
+        self.assertEqual(stream.take(3), [0, 2, 4])
+
+    def test_map_can_be_overridden_by_a_static_method(self):
+        class StaticStream(SinglyLinkedStream):
+            __slots__ = ()
+
+            @staticmethod
+            def map(fn, *streams, does_memoize=True):
+                return SinglyLinkedStream.map(
+                    fn,
+                    *streams,
+                    does_memoize=does_memoize,
+                )
+
+        self.assertFalse(StaticStream._maps_directly)
+        self.assertEqual(
+            StaticStream.map(
+                lambda x: x + 1,
+                StaticStream.from_iterable(count()),
+            ).take(3),
+            [1, 2, 3],
+        )
@@ -0,0 +1,101 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from array import array
+from operator import add, mul
+from unittest import TestCase
+
+from streams import PackedLinearStream
+
+
+class PackedLinearStreamTestCase(TestCase):
+    def test_typecode_of_iterables(self):
+        big = 2 ** 60 + 1
+        stream = PackedLinearStream.from_iterable(array('q', [big, 2, 3]))
+
+        self.assertEqual(stream.typecode, 'q')
+        self.assertEqual(stream[0], big)
+        self.assertEqual(
+            PackedLinearStream.from_iterable([1, 2]).typecode,
+            'd',
+        )
+        self.assertEqual(
+            PackedLinearStream.from_iterable(iter([1, 2]), typecode='b')
+            .typecode,
+            'b',
+        )
+
+    def test_typecode_of_derived_streams(self):
+        stream = PackedLinearStream.from_iterable(range(5), typecode='q')
+
+        self.assertEqual(stream.filter(lambda x: x > 2).typecode, 'q')
+        self.assertEqual(stream[1:].typecode, 'q')
+        self.assertEqual(stream[0:5:2].typecode, 'q')
+        self.assertEqual(
+            PackedLinearStream.from_iterable(stream).typecode,
+            'q',
+        )
+
+    def test_typecode_of_mapped_streams(self):
+        stream = PackedLinearStream.from_iterable(range(5), typecode='q')
+
+        self.assertEqual(
+            PackedLinearStream.map(lambda x: 2 * x, stream).typecode,
+            'q',
+        )
+        self.assertEqual(
+            PackedLinearStream.map(float, stream, typecode='d').typecode,
+            'd',
+        )
+
+    def test_empty_iterable(self):
+        self.assertIsNone(PackedLinearStream.from_iterable([]))
+        self.assertIsNone(PackedLinearStream.from_iterable(array('q')))
+
+    def test_indexing_at_the_bounds(self):
+        stream = PackedLinearStream.from_iterable(range(5), typecode='q')
+
+        self.assertEqual(stream[4], 4)
+        self.assertEqual(list(stream[4:5]), [4])
+
+        with self.assertRaises(IndexError):
+            stream[5]
+
+        with self.assertRaises(IndexError):
+            stream[:10]
+
+    def test_reduce_of_integers(self):
+        stream = PackedLinearStream.from_iterable(range(1, 6), typecode='q')
+
+        self.assertEqual(stream.reduce(add), 15)
+        self.assertEqual(stream.reduce(mul), 120)
+        self.assertEqual(stream.reduce(max), 5)
+        self.assertEqual(stream.reduce(min), 1)
+        self.assertEqual(stream.reduce(lambda a, b: a - b), -13)
+
+    def test_reduce_with_initial(self):
+        stream = PackedLinearStream.from_iterable(range(1, 6), typecode='q')
+
+        self.assertEqual(stream.reduce(add, 10), 25)
+        self.assertEqual(stream.reduce(add, 0.5), 15.5)
+        self.assertEqual(stream.reduce(mul, 0), 0)
+        self.assertEqual(stream.reduce(max, 9), 9)
+
+    def test_reduce_is_left_to_right(self):
+        floats = PackedLinearStream.from_iterable([1e16, 1.0, -1e16])
+        chars = PackedLinearStream.from_iterable('abc', typecode='u')
+
+        self.assertEqual(floats.reduce(add), 0.0)
+        self.assertEqual(chars.reduce(add), 'abc')
@@ -0,0 +1,94 @@
+# This file is part of Streams.
+#
+# Streams is free software: you can redistribute it and/or modify it
+# under the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or (at
+# your option) any later version.
+#
+# Streams is distributed in the hope that it will be useful, but
+# WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Streams.  If not, see <https://www.gnu.org/licenses/>.
+
+from itertools import count
+from operator import add
+from unittest import TestCase
+
+from streams import SinglyLinkedStream
+
+
+class SinglyLinkedStreamTestCase(TestCase):
+    def test_indexing_at_the_bounds(self):
+        stream = SinglyLinkedStream.from_iterable(range(5))
+
+        self.assertEqual(stream[0], 0)
+        self.assertEqual(stream[4], 4)
+
+        with self.assertRaises(IndexError):
+            stream[5]
+
+    def test_slicing_at_the_bounds(self):
+        stream = SinglyLinkedStream.from_iterable(range(5))
+
+        self.assertEqual(list(stream[3:]), [3, 4])
+        self.assertEqual(list(stream[1:4]), [1, 2, 3])
+        self.assertEqual(list(stream[4:5]), [4])
+        self.assertEqual(list(stream[0:5:2]), [0, 2, 4])
+        self.assertEqual(list(stream[0:10 ** 18:2]), [0, 2, 4])
+
+        with self.assertRaises(IndexError):
+            stream[5:]
+
+        with self.assertRaises(IndexError):
+            list(stream[:10 ** 18])
+
+    def test_infinite_stream(self):
+        stream = SinglyLinkedStream.from_iterable(count())
+
+        self.assertEqual(stream[1000], 1000)
+        self.assertEqual(list(stream[5:20:5]), [5, 10, 15])
+        self.assertEqual(stream[10 ** 6:].take(2), [10 ** 6, 10 ** 6 + 1])
+        self.assertEqual(stream.filter(lambda x: x % 7 == 0)[3], 21)
+        self.assertEqual(
+            SinglyLinkedStream.map(add, stream, stream).take(3),
+            [0, 2, 4],
+        )
+
+    def test_scan(self):
+        finite = SinglyLinkedStream.from_iterable(range(5))
+        infinite = SinglyLinkedStream.from_iterable(count())
+
+        self.assertEqual(
+            list(SinglyLinkedStream.scan(add, finite)),
+            [0, 1, 3, 6, 10],
+        )
+        self.assertEqual(
+            SinglyLinkedStream.scan(add, infinite).take(5),
+            [0, 1, 3, 6, 10],
+        )
+
+    def test_contains(self):
+        finite = SinglyLinkedStream.from_iterable(range(5))
+        infinite = SinglyLinkedStream.from_iterable(count())
+
+        self.assertIn(0, finite)
+        self.assertIn(4, finite)
+        self.assertNotIn(5, finite)
+        self.assertIn(1000, infinite)
+
+    def test_memoization(self):
+        calls = []
+
+        def values():
+            for value in range(3):
+                calls.append(value)
+                yield value
+
+        stream = SinglyLinkedStream.from_iterable(values())
+
+        self.assertEqual(list(stream), [0, 1, 2])
+        self.assertEqual(list(stream), [0, 1, 2])
+        self.assertEqual(calls, [0, 1, 2])